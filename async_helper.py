@@ -4,6 +4,7 @@ Provides a dedicated event loop in a separate thread for database operations.
 """
 from __future__ import annotations
 import asyncio
+import concurrent.futures
 import threading
 from typing import Any, Coroutine
 
@@ -32,14 +33,20 @@ def start_async_loop() -> None:
         time.sleep(0.01)
 
 
-def run_async(coro: Coroutine) -> Any:
-    """Run an async coroutine from sync code using the dedicated async event loop."""
-    global _async_loop
+# Seconds a blocking run_async call waits for its coroutine
+DEFAULT_TIMEOUT = 30
+
+
+def submit_async(coro: Coroutine) -> concurrent.futures.Future:
+    """Schedule a coroutine on the dedicated async event loop without waiting for it."""
     if _async_loop is None:
         start_async_loop()
-    
-    future = asyncio.run_coroutine_threadsafe(coro, _async_loop)
-    return future.result(timeout=30)  # 30 second timeout
+    return asyncio.run_coroutine_threadsafe(coro, _async_loop)
+
+
+def run_async(coro: Coroutine) -> Any:
+    """Run an async coroutine from sync code using the dedicated async event loop."""
+    return submit_async(coro).result(timeout=DEFAULT_TIMEOUT)
 
 
 def stop_async_loop() -> None:
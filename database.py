@@ -74,6 +74,8 @@ class PostgresBackend(DatabaseBackend):
     def __init__(self, config: DatabaseConfig):
         self.config = config
         self.pool: Optional[asyncpg.Pool] = None
+        # Schema DDL and migrations only need to run once per backend
+        self._schema_ready = False
     
     @property
     def is_connected(self) -> bool:
@@ -163,7 +165,7 @@ class PostgresBackend(DatabaseBackend):
     
     async def init_schema(self) -> None:
         """Initialize PostgreSQL schema."""
-        if not self.pool:
+        if not self.pool or self._schema_ready:
             return
         
         schema = """
@@ -220,6 +222,7 @@ class PostgresBackend(DatabaseBackend):
                 await conn.execute("CREATE INDEX IF NOT EXISTS idx_scores_hybrid ON scores(hybrid_score DESC)")
             except Exception:
                 pass
+        self._schema_ready = True
     
     async def _run_migrations(self, conn) -> None:
         """Run database migrations for existing PostgreSQL databases."""
@@ -295,6 +298,8 @@ class SQLiteBackend(DatabaseBackend):
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self.conn: Optional[aiosqlite.Connection] = None
+        # Schema DDL and migrations only need to run once per backend
+        self._schema_ready = False
     
     @property
     def is_connected(self) -> bool:
@@ -317,6 +322,8 @@ class SQLiteBackend(DatabaseBackend):
             self.conn.row_factory = aiosqlite.Row
             # Enable WAL mode for better concurrent access
             await self.conn.execute("PRAGMA journal_mode=WAL")
+            # WAL stays crash-safe with NORMAL sync and skips an fsync per commit
+            await self.conn.execute("PRAGMA synchronous=NORMAL")
             # Enable foreign keys
             await self.conn.execute("PRAGMA foreign_keys = ON")
             # Set busy timeout
@@ -397,7 +404,7 @@ class SQLiteBackend(DatabaseBackend):
     
     async def init_schema(self) -> None:
         """Initialize SQLite schema."""
-        if not self.conn:
+        if not self.conn or self._schema_ready:
             return
         
         # Create tables first (without indexes that may depend on columns we need to add)
@@ -465,6 +472,7 @@ class SQLiteBackend(DatabaseBackend):
                 except Exception:
                     pass  # Index might already exist or column might not exist yet
         await self.conn.commit()
+        self._schema_ready = True
     
     async def _run_migrations(self) -> None:
         """Run database migrations for existing databases."""
@@ -1354,11 +1362,28 @@ class DatabaseManager:
         query = "SELECT * FROM users WHERE email = $1"
         return await self.fetchrow(query, email)
     
+    async def get_user_auth(self, identifier: str) -> Optional[Dict]:
+        """Get the login columns (user_id, username, email, password_hash) of the
+        user whose username or email matches identifier (username wins a tie)."""
+        # Placeholders are numbered separately because SQLite maps each $N to a positional ?
+        query = """
+            SELECT user_id, username, email, password_hash FROM users
+            WHERE username = $1 OR email = $2
+            ORDER BY CASE WHEN username = $3 THEN 0 ELSE 1 END
+            LIMIT 1
+        """
+        return await self.fetchrow(query, identifier, identifier, identifier)
+    
     async def verify_login(self, username: str, password_hash: str) -> Optional[int]:
         """Verify login credentials. Returns user_id if valid."""
         query = "SELECT user_id FROM users WHERE username = $1 AND password_hash = $2"
         return await self.fetchval(query, username, password_hash)
     
+    async def update_password_hash(self, user_id: int, password_hash: str) -> None:
+        """Replace a user's stored password hash (e.g. after a hash scheme upgrade)."""
+        query = "UPDATE users SET password_hash = $1, updated_at = NOW() WHERE user_id = $2"
+        await self.execute(query, password_hash, user_id)
+    
     async def update_login_streak(self, user_id: int) -> int:
         """Update login streak for user. Returns new streak count."""
         # Get last login date
@@ -6,6 +6,9 @@ from systems.sound_manager import SoundManager
 import database  # Import module to access db dynamically
 from async_helper import run_async  # Use shared async helper
 
+# Posted by games to ask the app to return to the main menu
+BACK_TO_MENU = pygame.event.custom_type()
+
 
 class BaseGame:
     name: str = "base"
@@ -8,9 +8,10 @@ from dataclasses import dataclass
 from typing import List, Tuple, Set
 from collections import deque
 import pygame
-from . import BaseGame, register_game
+from . import BaseGame, register_game, BACK_TO_MENU
 from systems.rules import get_rules
-from systems.ai import astar
+from systems.ai import maze_grids
+from systems.ai_numba import astar
 from systems.scoring import ScoreBreakdown, calculate_score_breakdown
 
 # Import pre-defined constants from original games
@@ -364,7 +365,7 @@ class HybridPacManInvadersGame(BaseGame):
                         if key == "restart":
                             self._restart_level(full_reset=True)
                         else:
-                            pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"action": "back_to_menu"}))
+                            pygame.event.post(pygame.event.Event(BACK_TO_MENU))
                         break
             return
         
@@ -385,7 +386,7 @@ class HybridPacManInvadersGame(BaseGame):
                             self._restart_level(full_reset=True)
                             self.paused = False
                         elif key == "back":
-                            pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"action": "back_to_menu"}))
+                            pygame.event.post(pygame.event.Event(BACK_TO_MENU))
                         break
             return
         
@@ -609,21 +610,14 @@ class HybridPacManInvadersGame(BaseGame):
         return out
 
     def _ghost_astar(self, start: Vec2, goal: Vec2) -> List[Vec2] | None:
-        temp_grid = [row[:] for row in self.grid]
-        for tx, ty in self.tunnels:
-            if 0 <= ty < len(temp_grid) and 0 <= tx < len(temp_grid[0]):
-                temp_grid[ty][tx] = 1
-        for hx, hy in self.house_spaces:
-            if (hx, hy) not in (start, goal) and 0 <= hy < len(temp_grid) and 0 <= hx < len(temp_grid[0]):
-                temp_grid[hy][hx] = 1
-        return astar(start, goal, temp_grid)
+        grids = maze_grids(self.grid, self.tunnels, self.house_spaces)
+        if start in self.house_spaces or goal in self.house_spaces:
+            # Caged exit: only this query's own house tiles stay open
+            return astar(start, goal, grids.caged(start, goal))
+        return astar(start, goal, grids.ghost)
 
     def _ghost_astar_eyes(self, start: Vec2, goal: Vec2) -> List[Vec2] | None:
-        temp_grid = [row[:] for row in self.grid]
-        for tx, ty in self.tunnels:
-            if 0 <= ty < len(temp_grid) and 0 <= tx < len(temp_grid[0]):
-                temp_grid[ty][tx] = 1
-        return astar(start, goal, temp_grid)
+        return astar(start, goal, maze_grids(self.grid, self.tunnels, self.house_spaces).eyes)
 
     def _should_release(self, inv: Invader) -> bool:
         if inv.idx == 0:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 import random
 import pygame
-from . import BaseGame, register_game
+from . import BaseGame, register_game, BACK_TO_MENU
 from systems.rules import get_rules
 from systems.scoring import ScoreEvent, tetris_score, ScoreBreakdown, calculate_score_breakdown
 
@@ -286,7 +286,7 @@ class HybridTetrisGame(BaseGame):
                         if key == "restart":
                             self.reset()
                         elif key == "back":
-                            pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"action": "back_to_menu"}))
+                            pygame.event.post(pygame.event.Event(BACK_TO_MENU))
                         break
             return
         
@@ -5,9 +5,10 @@ from dataclasses import dataclass
 from typing import List, Tuple, Set
 from collections import deque
 import pygame
-from . import BaseGame, register_game
+from . import BaseGame, register_game, BACK_TO_MENU
 from systems.rules import get_rules
-from systems.ai import astar
+from systems.ai import maze_grids
+from systems.ai_numba import astar
 from systems.scoring import ScoreBreakdown, calculate_score_breakdown
 
 # Colors
@@ -100,6 +101,7 @@ class PacManGame(BaseGame):
         ) = self._parse_map(RAW_MAP)
         self.h = len(self.grid)
         self.w = len(self.grid[0])
+        self.heuristic_weight = get_rules("pac_man").data["heuristic_weight"]
         
         # Player-blocked tiles (ghost house)
         self.player_block = set(self.ghost_house_tiles) | set(self.house_spaces)
@@ -351,7 +353,7 @@ class PacManGame(BaseGame):
                         if key == "restart":
                             self._restart_level(full_reset=True)
                         else:
-                            pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"action": "back_to_menu"}))
+                            pygame.event.post(pygame.event.Event(BACK_TO_MENU))
                         break
             return
 
@@ -374,7 +376,7 @@ class PacManGame(BaseGame):
                             self._restart_level(full_reset=False)
                             self.paused = False
                         elif key == "back":
-                            pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"action": "back_to_menu"}))
+                            pygame.event.post(pygame.event.Event(BACK_TO_MENU))
                         break
             return
 
@@ -638,11 +640,7 @@ class PacManGame(BaseGame):
 
     def _ghost_astar_eyes(self, start: Vec2, goal: Vec2) -> List[Vec2] | None:
         """A* for eyes: exclude tunnels only, allow house tiles."""
-        temp_grid = [row[:] for row in self.grid]
-        for tx, ty in self.tunnels:
-            if 0 <= ty < len(temp_grid) and 0 <= tx < len(temp_grid[0]):
-                temp_grid[ty][tx] = 1
-        return astar(start, goal, temp_grid)
+        return astar(start, goal, maze_grids(self.grid, self.tunnels, self.house_spaces).eyes)
 
     def _should_release(self, g: Ghost) -> bool:
         if g.idx == 0:
@@ -691,12 +689,7 @@ class PacManGame(BaseGame):
 
     def _ghost_astar(self, start: Vec2, goal: Vec2) -> List[Vec2] | None:
         """A* for ghosts: exclude tunnels from pathfinding grid (they teleport manually)."""
-        # Clone grid and mark tunnel tiles as walls temporarily
-        temp_grid = [row[:] for row in self.grid]
-        for tx, ty in self.tunnels:
-            if 0 <= ty < len(temp_grid) and 0 <= tx < len(temp_grid[0]):
-                temp_grid[ty][tx] = 1  # block tunnels in pathfinding
-        return astar(start, goal, temp_grid)
+        return astar(start, goal, maze_grids(self.grid, self.tunnels, self.house_spaces).eyes, weight=self.heuristic_weight)
 
     def _resolve_collision(self, g: Ghost) -> None:
         pnode = (int(self.player.x), int(self.player.y))
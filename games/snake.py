@@ -1,10 +1,10 @@
 from __future__ import annotations
 import random
 import pygame
-from . import BaseGame, register_game
+from . import BaseGame, register_game, BACK_TO_MENU
 from systems.rules import get_rules
 from systems.scoring import ScoreEvent, snake_score, ScoreBreakdown, calculate_score_breakdown
-from systems.collision import point_in_grid
+from systems.collision import GridOccupancy, point_in_grid
 
 # Map size configurations
 MAP_SIZES = {
@@ -39,6 +39,9 @@ class SnakeGame(BaseGame):
         start_x = min(5, self.grid_w // 4)
         start_y = self.grid_h // 2
         self.snake = [(start_x, start_y), (start_x - 1, start_y), (start_x - 2, start_y)]
+        # Cells covered by the body, kept in step with self.snake for O(1) self-collision
+        self.occupancy = GridOccupancy(self.grid_w, self.grid_h)
+        self._sync_occupancy()
         self.apple = (10, 8)
         self.timer = 0.0
         # Use map-specific speed or fall back to rules
@@ -104,6 +107,7 @@ class SnakeGame(BaseGame):
         start_x = min(5, self.grid_w // 4)
         start_y = self.grid_h // 2
         self.snake = [(start_x, start_y), (start_x - 1, start_y), (start_x - 2, start_y)]
+        self._sync_occupancy()
         self.spawn_apple()
         self.timer = 0.0
         self.game_over = False
@@ -112,8 +116,14 @@ class SnakeGame(BaseGame):
         self.time_played = 0.0
         self.score_breakdown = None
 
+    def _sync_occupancy(self) -> None:
+        self.occupancy.clear()
+        for x, y in self.snake:
+            self.occupancy.add(self.occupancy.index(x, y))
+
     def spawn_apple(self) -> None:
-        free = [(x, y) for x in range(self.grid_w) for y in range(self.grid_h) if (x, y) not in self.snake]
+        occ = self.occupancy
+        free = [(x, y) for x in range(self.grid_w) for y in range(self.grid_h) if not occ.contains(occ.index(x, y))]
         self.apple = random.choice(free) if free else (0, 0)
 
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -127,7 +137,7 @@ class SnakeGame(BaseGame):
                             self.reset()
                         elif key == "back":
                             # Tell main to return to menu
-                            pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"action": "back_to_menu"}))
+                            pygame.event.post(pygame.event.Event(BACK_TO_MENU))
                         break
             return
 
@@ -165,19 +175,22 @@ class SnakeGame(BaseGame):
         dx, dy = self.direction
         new_head = (head_x + dx, head_y + dy)
         # Collision with walls or self → Game Over
-        if not point_in_grid(new_head, (self.grid_w, self.grid_h)) or new_head in self.snake:
+        if (not point_in_grid(new_head, (self.grid_w, self.grid_h))
+                or self.occupancy.contains(self.occupancy.index(*new_head))):
             self.game_over = True
             self._calculate_final_score()
             self.save_score()  # Save score to database
             return
         self.snake.insert(0, new_head)
+        self.occupancy.add(self.occupancy.index(*new_head))
         if new_head == self.apple:
             self.fruits_eaten += 1
             self.score += snake_score(ScoreEvent(fruits_eaten=1))
             self.sounds.play("eat")
             self.spawn_apple()
         else:
-            self.snake.pop()
+            tail_x, tail_y = self.snake.pop()
+            self.occupancy.remove(self.occupancy.index(tail_x, tail_y))
 
     def draw(self) -> None:
         # Recalculate layout if screen size changed (e.g. fullscreen toggle)
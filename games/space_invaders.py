@@ -1,9 +1,9 @@
 from __future__ import annotations
 import pygame
 import random
-from . import BaseGame, register_game
+from . import BaseGame, register_game, BACK_TO_MENU
 from systems.rules import get_rules
-from systems.collision import rect_vs_many
+from systems.collision import SpatialHash, rect_vs_many, rect_vs_many_indices
 from systems.scoring import ScoreEvent, invaders_score, ScoreBreakdown, calculate_score_breakdown
 
 # Colors
@@ -271,7 +271,7 @@ class SpaceInvadersGame(BaseGame):
                         if key == "restart":
                             self.reset()
                         else:
-                            pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"action": "back_to_menu"}))
+                            pygame.event.post(pygame.event.Event(BACK_TO_MENU))
                         break
             return
         
@@ -378,12 +378,17 @@ class SpaceInvadersGame(BaseGame):
             for enemy_rect, _ in self.enemies:
                 enemy_rect.x += movement
 
-        # Player bullet collisions with enemies
+        # Player bullet collisions with enemies (broad phase over this frame's positions)
+        enemy_hash = SpatialHash(max(int(40 * self.sx), int(28 * self.sy)))
+        for i, (enemy_rect, _) in enumerate(self.enemies):
+            enemy_hash.insert(enemy_rect, i)
+        destroyed: set[int] = set()
         for bullet in list(self.bullets):
-            hits = [(enemy_rect, enemy_type) for enemy_rect, enemy_type in self.enemies if bullet.colliderect(enemy_rect)]
+            hits = [i for i, r in enemy_hash.query_items(bullet).items()
+                    if i not in destroyed and bullet.colliderect(r)]
             if hits:
                 self.score += invaders_score(ScoreEvent(enemies_destroyed=len(hits)))
-                self.enemies = [(r, t) for r, t in self.enemies if (r, t) not in hits]
+                destroyed.update(hits)
                 if bullet in self.bullets:
                     self.bullets.remove(bullet)
                 continue
@@ -399,12 +404,14 @@ class SpaceInvadersGame(BaseGame):
             
             # Check bunker hit by player bullet
             for bunker in self.bunkers:
-                for block in list(bunker):
-                    if bullet.colliderect(block):
-                        bunker.remove(block)
-                        if bullet in self.bullets:
-                            self.bullets.remove(bullet)
-                        break
+                idx = bullet.collidelist(bunker)
+                if idx != -1:
+                    del bunker[idx]
+                    if bullet in self.bullets:
+                        self.bullets.remove(bullet)
+
+        if destroyed:
+            self.enemies = [e for i, e in enumerate(self.enemies) if i not in destroyed]
 
         # Enemy bullet collisions with player
         for bullet in list(self.enemy_bullets):
@@ -423,19 +430,17 @@ class SpaceInvadersGame(BaseGame):
             
             # Check bunker hit by enemy bullet
             for bunker in self.bunkers:
-                for block in list(bunker):
-                    if bullet.colliderect(block):
-                        bunker.remove(block)
-                        if bullet in self.enemy_bullets:
-                            self.enemy_bullets.remove(bullet)
-                        break
+                idx = bullet.collidelist(bunker)
+                if idx != -1:
+                    del bunker[idx]
+                    if bullet in self.enemy_bullets:
+                        self.enemy_bullets.remove(bullet)
 
         # Enemy collision with bunkers (destroy bunker blocks)
         for enemy_rect, _ in self.enemies:
             for bunker in self.bunkers:
-                for block in list(bunker):
-                    if enemy_rect.colliderect(block):
-                        bunker.remove(block)
+                for i in reversed(rect_vs_many_indices(enemy_rect, bunker)):
+                    del bunker[i]
 
         # Check if all enemies are defeated - spawn new wave
         if not self.enemies:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 import random
 import pygame
-from . import BaseGame, register_game
+from . import BaseGame, register_game, BACK_TO_MENU
 from systems.rules import get_rules
 from systems.scoring import ScoreEvent, tetris_score, ScoreBreakdown, calculate_score_breakdown
 
@@ -261,7 +261,7 @@ class TetrisGame(BaseGame):
                         if key == "restart":
                             self.reset()
                         elif key == "back":
-                            pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"action": "back_to_menu"}))
+                            pygame.event.post(pygame.event.Event(BACK_TO_MENU))
                         break
             return
         # Block input while clearing animation runs
@@ -1,17 +1,90 @@
 from __future__ import annotations
 import sys
+from enum import IntEnum
+from functools import lru_cache
 import pygame
+import pygame.gfxdraw
 import asyncio
 from settings import Settings, ensure_directories, init_pygame_window
 from systems.sound_manager import SoundManager
+from systems.pacer import Pacer
 from systems.rules import set_difficulty, get_difficulty
-from games import GAME_REGISTRY
+from games import GAME_REGISTRY, BACK_TO_MENU
 from leaderboard import LeaderboardView
 from user import UserSession
 import database
 from database import DatabaseManager
 from login_register_menu import LoginRegisterMenu
-from async_helper import run_async, stop_async_loop
+from async_helper import DEFAULT_TIMEOUT, run_async, stop_async_loop, submit_async
+
+# Event types the app and games actually handle; everything else is blocked at the SDL queue
+ALLOWED_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.TEXTINPUT,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.WINDOWEXPOSED,
+    BACK_TO_MENU,
+]
+
+# States whose screen only changes in response to input; frames are skipped while nothing changed
+IDLE_STATES = ("menu", "settings", "leaderboard", "hybrid_select", "snake_select")
+# Input that can change what an idle screen shows (hover, clicks, window exposure)
+REDRAW_EVENTS = frozenset((
+    pygame.KEYDOWN,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.WINDOWEXPOSED,
+))
+
+# Sounds shared by every game, loaded at startup
+SHARED_SOUNDS = ("game_over",)
+# Per-game sound effects (SoundManager.DEFAULT_SOUNDS keys), preloaded the first time that game starts
+_PER_GAME_SOUNDS = {
+    "snake": ("eat",),
+    "tetris": ("line_clear",),
+    "pac_man": ("chomp", "power_up"),
+    "space_invaders": ("shoot", "power_up"),
+    "hybrid": ("eat", "power_up"),
+    "hybrid_tetris": ("line_clear",),
+    "hybrid_pacman_invaders": ("chomp", "power_up"),
+    "hybrid_space_tetris": ("line_clear",),
+}
+
+class BKey(IntEnum):
+    """Pause/settings button and slider keys."""
+    RESUME = 0
+    RESTART = 1
+    SETTINGS = 2
+    BACK = 3
+    TOGGLE_FULLSCREEN = 4
+    TOGGLE_MUTE = 5
+    TOGGLE_FPS = 6
+    DIFF_EASY = 7
+    DIFF_INT = 8
+    DIFF_HARD = 9
+    SFX_SLIDER = 10
+
+
+PAUSE_LABELS = {
+    BKey.RESUME: "Resume",
+    BKey.SETTINGS: "Settings",
+    BKey.RESTART: "Restart",
+    BKey.BACK: "Back To Main Menu",
+}
+# Static settings labels; mute/FPS labels depend on the current setting
+SETTINGS_LABELS = {
+    BKey.TOGGLE_FULLSCREEN: "Toggle Fullscreen",
+    BKey.BACK: "Back",
+    BKey.DIFF_EASY: "Easy",
+    BKey.DIFF_INT: "Normal",
+    BKey.DIFF_HARD: "Hard",
+}
+DIFFICULTY_BY_KEY = {BKey.DIFF_EASY: "easy", BKey.DIFF_INT: "intermediate", BKey.DIFF_HARD: "hard"}
 
 MENU_OPTIONS = ["snake", "tetris", "pac_man", "space_invaders", "hybrid", "leaderboard", "quit"]
 DIFFICULTY_OPTIONS = ["easy", "intermediate", "hard"]
@@ -30,16 +103,92 @@ SNAKE_MAP_OPTIONS = [
     ("normal", "Normal", "Standard Map (30x20)", "Balanced challenge"),
     ("hard", "Hard", "Small Map (20x15)", "Fast collisions, high challenge"),
 ]
+# Difficulty colors, index-aligned with SNAKE_MAP_OPTIONS (green / yellow / red)
+SNAKE_DIFFICULTY_COLORS = ((100, 200, 100), (200, 200, 100), (200, 100, 100))
+
+# Hover color tables, indexed by int(hovered): (normal, hovered)
+BTN_FILL = ((40, 45, 85), (70, 80, 120))
+BTN_BORDER = ((140, 150, 190), (255, 255, 255))
+MENU_BTN_FILL = ((35, 40, 80), (60, 70, 120))
+MENU_BTN_BORDER = ((120, 130, 180), (255, 255, 255))
+SNAKE_CARD_FILL = ((30, 50, 40), (40, 70, 50))
+SNAKE_DESC_COLOR = ((150, 180, 150), (180, 220, 180))
+SNAKE_PLAY_FILL = ((40, 80, 50), (60, 120, 80))
+SNAKE_BACK_FILL = ((40, 60, 50), (60, 90, 70))
+SNAKE_BACK_BORDER = ((120, 150, 130), (255, 255, 255))
+HYBRID_CARD_FILL = ((35, 40, 80), (50, 60, 100))
+HYBRID_CARD_BORDER = ((100, 120, 180), (255, 255, 255))
+HYBRID_DESC_COLOR = ((150, 170, 200), (200, 220, 255))
+HYBRID_SELECT_FILL = ((50, 70, 110), (70, 100, 150))
+
+# Selection card geometry (snake: one row, hybrid: 2-column grid)
+SNAKE_CARD_SIZE = (200, 200)
+SNAKE_CARD_SPACING = 30
+SNAKE_CARD_TOP = 170
+HYBRID_CARD_SIZE = (320, 140)
+HYBRID_CARD_SPACING = (40, 30)
+HYBRID_CARD_TOP = 160
+HYBRID_COLUMNS = 2
+
+
+def _stack_hit(rects: list[tuple[str, pygame.Rect]], base_y: int, spacing: int, mx: int, my: int) -> int:
+    """Index of the button under (mx, my) in an evenly spaced vertical stack, or -1."""
+    idx = (my - base_y) // spacing
+    if 0 <= idx < len(rects) and rects[idx][1].collidepoint(mx, my):
+        return idx
+    return -1
+
+
+def _slider_fraction(mouse_x: int, track_x: int, track_w: int) -> float:
+    """Slider value (0.0 to 1.0) for a mouse x over a track."""
+    return max(0.0, min(1.0, (mouse_x - track_x) / track_w))
+
+
+@lru_cache(maxsize=8)
+def _snake_layout(width: int, n: int) -> tuple[tuple[int, int, int, int], ...]:
+    """Compute (x, y, w, h) for n snake map cards laid out in a centered row."""
+    card_w, card_h = SNAKE_CARD_SIZE
+    total_width = n * card_w + (n - 1) * SNAKE_CARD_SPACING
+    start_x = width // 2 - total_width // 2
+    return tuple(
+        (start_x + i * (card_w + SNAKE_CARD_SPACING), SNAKE_CARD_TOP, card_w, card_h)
+        for i in range(n)
+    )
+
+
+@lru_cache(maxsize=8)
+def _hybrid_layout(width: int, n: int) -> tuple[tuple[int, int, int, int], ...]:
+    """Compute (x, y, w, h) for n hybrid mode cards laid out in a centered grid."""
+    card_w, card_h = HYBRID_CARD_SIZE
+    h_spacing, v_spacing = HYBRID_CARD_SPACING
+    total_width = HYBRID_COLUMNS * card_w + (HYBRID_COLUMNS - 1) * h_spacing
+    start_x = width // 2 - total_width // 2
+    return tuple(
+        (start_x + (i % HYBRID_COLUMNS) * (card_w + h_spacing),
+         HYBRID_CARD_TOP + (i // HYBRID_COLUMNS) * (card_h + v_spacing),
+         card_w, card_h)
+        for i in range(n)
+    )
 
 class ArcadeApp:
     def __init__(self):
         ensure_directories()
         pygame.init()
         pygame.mixer.init()
+        # Keep touch, joystick, audio-device etc. events out of the queue entirely
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(ALLOWED_EVENTS)
         self.cfg = Settings()
+        # Start the (network-bound) DB connect first so it overlaps the
+        # window setup and (disk-bound) sound loading below
+        self.db: DatabaseManager | None = None
+        self._db_future = submit_async(self._init_database())
         self.screen = init_pygame_window(self.cfg)
-        self.clock = pygame.time.Clock()
+        self.pacer = Pacer(self.cfg.fps)
         self.font = pygame.font.SysFont("arial", 28)
+        self.title_font = pygame.font.SysFont("arial", 36)
+        self.label_font = pygame.font.SysFont("arial", 18)
+        self.note_font = pygame.font.SysFont("arial", 14)
         self.sounds = SoundManager()
         self.load_sounds()
         self.state = "login"  # Start with login screen
@@ -50,16 +199,32 @@ class ArcadeApp:
         self.menu_button_rects: list[tuple[str, pygame.Rect]] = []
         # Pause state
         self.paused: bool = False
-        self.pause_button_rects: list[tuple[str, pygame.Rect]] = []
+        self.pause_button_rects: list[tuple[BKey, pygame.Rect]] = []
         # Settings UI
         self.menu_settings_rect: pygame.Rect | None = None
         self.menu_login_rect: pygame.Rect | None = None  # Top-left login/logout button
-        self.settings_button_rects: list[tuple[str, pygame.Rect]] = []
-        self.settings_slider_rects: dict[str, tuple[pygame.Rect, pygame.Rect]] = {}  # label_rect, slider_rect
+        self.settings_button_rects: list[tuple[BKey, pygame.Rect]] = []
+        self.settings_slider_rects: dict[BKey, tuple[pygame.Rect, pygame.Rect]] = {}  # label_rect, slider_rect
         self.settings_return_state: str = "menu"  # "menu" or "pause"
-        self.dragging_slider: str | None = None  # Which slider is being dragged
+        self.dragging_slider: BKey | None = None  # Which slider is being dragged
+        # Layout signatures the cached button rects were built for (None = stale)
+        self._menu_sig: tuple | None = None
+        self._settings_sig: tuple | None = None
+        self._pause_sig: tuple | None = None
+        # Vertical stack geometry of the menu/pause buttons, for O(1) hit-testing
+        self._menu_base_y, self._menu_spacing = 0, 1
+        self._pause_base_y, self._pause_spacing = 0, 1
+        # Redraw tracking for idle (non-animated) states
+        self._dirty: bool = True
+        self._last_mouse_pos: tuple[int, int] | None = None
+        self._drawn_state: str | None = None
         # Remember last windowed size when toggling fullscreen
         self.windowed_size = self.cfg.screen_size
+        # Display mode changes are applied once at the next frame boundary
+        self._pending_display_change: bool = False
+        self._display_version: int = 0
+        # Display version each screen-drawing dependent was last bound to
+        self._bound_display: dict[str, int] = {"leaderboard": 0, "login": 0, "game": 0}
         # Hybrid mode selection
         self.hybrid_selection_rects: list[tuple[str, pygame.Rect]] = []
         self.hybrid_back_rect: pygame.Rect | None = None
@@ -67,12 +232,52 @@ class ArcadeApp:
         self.snake_selection_rects: list[tuple[str, pygame.Rect]] = []
         self.snake_back_rect: pygame.Rect | None = None
         self.selected_snake_map: str = "normal"  # Default to normal map
-        self.db: DatabaseManager | None = None
-        run_async(self._init_database())
+        # Rendered text surfaces keyed by (font, text, color)
+        self._text_cache: dict[tuple[pygame.font.Font, str, tuple[int, int, int]], pygame.Surface] = {}
+        # FPS counter text keyed by the integer reading, and its backdrop keyed by size
+        self._fps_cache: dict[int, pygame.Surface] = {}
+        self._fps_bg_cache: dict[tuple[int, int], pygame.Surface] = {}
+        # Rounded button chrome keyed by (size, fill, border, radius, border_width)
+        self._chrome_cache: dict[tuple, pygame.Surface] = {}
+        # Translucent dimming overlays keyed by (size, alpha)
+        self._overlay_cache: dict[tuple[tuple[int, int], int], pygame.Surface] = {}
+        # Pre-rendered static backgrounds (fill + title/subtitle/notes)
+        self._menu_bg: pygame.Surface | None = None
+        self._snake_bg: pygame.Surface | None = None
+        self._hybrid_bg: pygame.Surface | None = None
+        # Fixed labels drawn every frame on the overlays, rendered up front
+        self._static_text: dict[str, pygame.Surface] = {}
+        self._build_static_text()
+        self._build_backgrounds()
+        # Connect finished in the background while the window and assets loaded;
+        # block once so self.db is ready before any menu or game can reach it
+        self._db_future.result(timeout=DEFAULT_TIMEOUT)
         # Login/Register menu
         self.login_menu: LoginRegisterMenu | None = None
         self.session: UserSession = UserSession()
         self._init_login_menu()
+        # Per-state event dispatch tables: {event_type: handler}
+        self._state_dispatch = {
+            "login": self.handle_login_event,
+            "menu": self.handle_menu_event,
+            "hybrid_select": self.handle_hybrid_select_event,
+            "snake_select": self.handle_snake_select_event,
+            "game": self.handle_game_event,
+            "leaderboard": self.handle_leaderboard_event,
+            "settings": self.handle_settings_event,
+        }
+        self._menu_dispatch = {
+            pygame.MOUSEMOTION: self._on_menu_motion,
+            pygame.MOUSEBUTTONDOWN: self._on_menu_click,
+        }
+        self._pause_dispatch = {
+            pygame.MOUSEBUTTONDOWN: self._on_pause_click,
+        }
+        self._settings_dispatch = {
+            pygame.MOUSEBUTTONDOWN: self._on_settings_click,
+            pygame.MOUSEBUTTONUP: self._on_settings_release,
+            pygame.MOUSEMOTION: self._on_settings_motion,
+        }
 
     async def _init_database(self):
         """Initialize database connection asynchronously."""
@@ -86,29 +291,129 @@ class ArcadeApp:
         if self.db:
             self.login_menu = LoginRegisterMenu(self.screen, self.cfg, self.font, self.db)
 
+    def _render_cached(self, font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """Render text once and reuse the surface, converted to the display format for fast blits."""
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            # convert_alpha needs a display surface; skip caching until one exists
+            if pygame.display.get_surface() is None:
+                return surf
+            surf = surf.convert_alpha()
+            self._text_cache[key] = surf
+        return surf
+
+    def _draw_btn(self, rect: pygame.Rect, fill: tuple[int, int, int], border: tuple[int, int, int],
+                  radius: int = 8, border_width: int = 2) -> None:
+        """Draw a button box: gfxdraw for square 1px-bordered boxes, cached chrome otherwise."""
+        if radius == 0 and border_width == 1:
+            pygame.gfxdraw.box(self.screen, rect, fill)
+            pygame.gfxdraw.rectangle(self.screen, rect, border)
+            return
+        self.screen.blit(self._button_chrome(rect.size, fill, border, radius, border_width), rect)
+
+    def _button_chrome(self, size: tuple[int, int], fill: tuple[int, int, int], border: tuple[int, int, int],
+                       radius: int, border_width: int = 2) -> pygame.Surface:
+        """Rounded button fill + border, rendered once per look and reused as a plain blit."""
+        key = (size, fill, border, radius, border_width)
+        surf = self._chrome_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            rect = surf.get_rect()
+            pygame.draw.rect(surf, fill, rect, border_radius=radius)
+            pygame.draw.rect(surf, border, rect, width=border_width, border_radius=radius)
+            self._chrome_cache[key] = surf
+        return surf
+
+    def _get_overlay(self, size: tuple[int, int], alpha: int) -> pygame.Surface:
+        """Return a cached black overlay of the given size and alpha."""
+        key = (size, alpha)
+        overlay = self._overlay_cache.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(size, pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, alpha))
+            self._overlay_cache[key] = overlay
+        return overlay
+
+    def _render(self, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """Render text in the default UI font through the text cache."""
+        return self._render_cached(self.font, text, color)
+
+    def _build_static_text(self) -> None:
+        """Render the overlay titles and fixed button labels for the current display."""
+        white = (255, 255, 255)
+        self._static_text = {
+            "paused": self._render("Paused", white),
+            "settings_title": self._render("Settings", white),
+            "difficulty_label": self._render("Difficulty:", white),
+            "settings_button": self._render("Settings", white),
+            "back_to_menu": self._render("Back to Menu", white),
+        }
+
+    def _build_backgrounds(self) -> None:
+        """Render the static parts of the menu screens once for the current window size."""
+        center_x = self.cfg.width // 2
+
+        def blit_centered(surface: pygame.Surface, text_surf: pygame.Surface, y: int) -> None:
+            surface.blit(text_surf, (center_x - text_surf.get_width() // 2, y))
+
+        # Main menu
+        self._menu_bg = pygame.Surface(self.cfg.screen_size).convert()
+        self._menu_bg.fill((20, 20, 50))
+        blit_centered(self._menu_bg, self.font.render("Retro Arcade Game", True, (255, 255, 255)), 60)
+
+        # Snake map selection (green-tinted background for Snake theme)
+        self._snake_bg = pygame.Surface(self.cfg.screen_size).convert()
+        self._snake_bg.fill((20, 50, 30))
+        blit_centered(self._snake_bg, self.title_font.render("Select Snake Map Size", True, (255, 255, 255)), 60)
+        blit_centered(self._snake_bg, self.font.render("Choose your preferred difficulty level", True, (180, 220, 180)), 110)
+        # Examiner justification note at bottom
+        note = self.note_font.render(
+            "Map variety increases replayability and allows players of different skill levels to tailor the challenge.",
+            True, (120, 150, 130)
+        )
+        blit_centered(self._snake_bg, note, self.cfg.height - 40)
+
+        # Hybrid mode selection
+        self._hybrid_bg = pygame.Surface(self.cfg.screen_size).convert()
+        self._hybrid_bg.fill((20, 20, 50))
+        blit_centered(self._hybrid_bg, self.title_font.render("Select Hybrid Mode", True, (255, 255, 255)), 60)
+        blit_centered(self._hybrid_bg, self.font.render("Only one hybrid mode can be active at a time", True, (180, 180, 200)), 110)
+        # Examiner justification note at bottom
+        note = self.note_font.render(
+            "Each hybrid activates a predefined configuration ensuring mechanical compatibility.",
+            True, (120, 130, 160)
+        )
+        blit_centered(self._hybrid_bg, note, self.cfg.height - 40)
+
     def load_sounds(self) -> None:
-        # Load all default sounds
-        self.sounds.load_assets()
-        # Also load specific sounds that might have different filenames
-        self.sounds.load_sound("eat", "eat.mp3")
-        self.sounds.load_sound("shoot", "shoot.wav")
-        self.sounds.load_sound("power_up", "power_up.wav")
-        self.sounds.load_sound("line_clear", "line_clear.wav")
-        self.sounds.load_sound("game_over", "game_over.wav")
+        # Only shared sounds up front; per-game effects load in _launch_game
+        self.sounds.preload(SHARED_SOUNDS)
         # Apply initial volume settings
         self.sounds.set_volume(self.cfg.audio.sfx_volume)
         self.sounds.set_muted(self.cfg.audio.muted)
 
     def _draw_fps(self) -> None:
         """Draw FPS counter in bottom-left corner."""
-        fps = int(self.clock.get_fps())
-        fps_text = self.font.render(f"FPS: {fps}", True, (0, 255, 0))
+        fps = int(self.pacer.get_fps())
+        fps_text = self._fps_cache.get(fps)
+        if fps_text is None:
+            # Bound the cache if the reading ever wanders far (e.g. uncapped spikes)
+            if len(self._fps_cache) > 200:
+                self._fps_cache.clear()
+            fps_text = self._fps_cache[fps] = self.font.render(f"FPS: {fps}", True, (0, 255, 0))
         # Position in bottom-left corner
         x = 14
         y = self.cfg.height - fps_text.get_height() - 14
         # Draw background for readability
-        bg_rect = pygame.Rect(x - 4, y - 2, fps_text.get_width() + 8, fps_text.get_height() + 4)
-        pygame.draw.rect(self.screen, (0, 0, 0, 150), bg_rect, border_radius=4)
+        size = (fps_text.get_width() + 8, fps_text.get_height() + 4)
+        bg = self._fps_bg_cache.get(size)
+        if bg is None:
+            bg = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(bg, (0, 0, 0), bg.get_rect(), border_radius=4)
+            self._fps_bg_cache[size] = bg
+        self.screen.blit(bg, (x - 4, y - 2))
         self.screen.blit(fps_text, (x, y))
 
     def cleanup(self):
@@ -121,52 +426,91 @@ class ArcadeApp:
     def run(self) -> None:
         try:
             while True:
-                dt = self.clock.tick(self.cfg.fps) / 1000.0
-                for event in pygame.event.get():
+                if self._pending_display_change:
+                    self._pending_display_change = False
+                    self.apply_display_mode()
+                if not self._needs_redraw():
+                    # Idle screen with nothing to redraw: block in the OS until input arrives
+                    events = self._wait_for_events()
+                    dt = self.pacer.mark()
+                else:
+                    dt = self.pacer.beat()
+                    # Pump once, then drain the whole queue in one batch
+                    pygame.event.pump()
+                    events = pygame.event.get(pump=False)
+                for event in self._coalesce_motion(events):
                     if event.type == pygame.QUIT:
                         pygame.quit()
                         sys.exit()
+                    if event.type in REDRAW_EVENTS:
+                        self._dirty = True
                     self.handle_event(event)
                 self.update(dt)
-                self.draw()
-                if self.cfg.show_fps:
-                    self._draw_fps()
-                pygame.display.flip()
+                if self._needs_redraw():
+                    self.draw()
+                    if self.cfg.show_fps:
+                        self._draw_fps()
+                    pygame.display.flip()
+                    self._dirty = False
+                    self._drawn_state = self.state
         finally:
             self.cleanup()
 
+    def _wait_for_events(self) -> list[pygame.event.Event]:
+        """Sleep until an event arrives (or one frame period passes), then drain the queue."""
+        first = pygame.event.wait(int(self.pacer.period * 1000))
+        if first.type == pygame.NOEVENT:
+            return pygame.event.get()
+        return [first] + pygame.event.get()
+
+    def _needs_redraw(self) -> bool:
+        """Animated states redraw every frame; idle screens only when something changed."""
+        if self.state not in IDLE_STATES or self.cfg.show_fps:
+            return True
+        return self._dirty or self.state != self._drawn_state or self.dragging_slider is not None
+
+    @staticmethod
+    def _coalesce_motion(events: list[pygame.event.Event]) -> list[pygame.event.Event]:
+        """Drop all but the last MOUSEMOTION in a batch; only the final pointer position matters."""
+        last_motion = -1
+        for i, event in enumerate(events):
+            if event.type == pygame.MOUSEMOTION:
+                last_motion = i
+        if last_motion < 0:
+            return events
+        return [e for i, e in enumerate(events) if e.type != pygame.MOUSEMOTION or i == last_motion]
+
     def handle_event(self, event: pygame.event.Event) -> None:
-        if self.state == "login":
-            self.handle_login_event(event)
-        elif self.state == "menu":
-            self.handle_menu_event(event)
-        elif self.state == "hybrid_select":
-            self.handle_hybrid_select_event(event)
-        elif self.state == "snake_select":
-            self.handle_snake_select_event(event)
-        elif self.state == "game" and self.active_game:
-            # Toggle pause on ESC
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                self.paused = not self.paused
-                return
-            # From games: request to go back to menu
-            if event.type == pygame.USEREVENT and getattr(event, "action", None) == "back_to_menu":
-                self.active_game.stop()
-                self.active_game = None
-                self.paused = False
-                self.state = "menu"
-                return
-            # While paused, handle pause/settings only
+        handler = self._state_dispatch.get(self.state)
+        if handler:
+            handler(event)
+
+    def handle_game_event(self, event: pygame.event.Event) -> None:
+        if not self.active_game:
+            return
+        # Toggle pause on ESC
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.paused = not self.paused
             if self.paused:
-                self.handle_pause_event(event)
-            else:
-                self.active_game.handle_event(event)
-        elif self.state == "leaderboard":
-            result = self.leaderboard.handle_event(event)
-            if result == "back":
-                self.state = "menu"
-        elif self.state == "settings":
-            self.handle_settings_event(event)
+                self._ensure_pause_buttons()
+            return
+        # From games: request to go back to menu
+        if event.type == BACK_TO_MENU:
+            self.active_game.stop()
+            self.active_game = None
+            self.paused = False
+            self.state = "menu"
+            return
+        # While paused, handle pause/settings only
+        if self.paused:
+            self.handle_pause_event(event)
+        else:
+            self.active_game.handle_event(event)
+
+    def handle_leaderboard_event(self, event: pygame.event.Event) -> None:
+        result = self.leaderboard.handle_event(event)
+        if result == "back":
+            self.state = "menu"
 
     def handle_login_event(self, event: pygame.event.Event) -> None:
         """Handle events for the login/register menu."""
@@ -184,47 +528,54 @@ class ArcadeApp:
                 self.state = "menu"
 
     def handle_menu_event(self, event: pygame.event.Event) -> None:
-        # Ensure rects exist for hit-testing
-        if not self.menu_button_rects:
-            self.build_menu_buttons()
-        # Build settings button rect for hit-testing
-        if not self.menu_settings_rect:
-            self.menu_settings_rect = self.build_menu_settings_button()
-
-        if event.type == pygame.MOUSEMOTION:
-            mx, my = event.pos
-            for idx, (option, rect) in enumerate(self.menu_button_rects):
-                if rect.collidepoint(mx, my):
-                    self.menu_index = idx
-                    break
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mx, my = event.pos
-            # Top-right settings button
-            if self.menu_settings_rect and self.menu_settings_rect.collidepoint(mx, my):
-                self.settings_return_state = "menu"
-                self.state = "settings"
-                return
-            # Top-left login/logout button
-            if self.menu_login_rect and self.menu_login_rect.collidepoint(mx, my):
-                if self.session.is_logged_in:
-                    self.do_logout()
-                else:
-                    # Guest mode - go to login screen
-                    self.state = "login"
-                    if self.login_menu:
-                        self.login_menu.reset()
-                return
-            # Menu buttons
-            for option, rect in self.menu_button_rects:
-                if rect.collidepoint(mx, my):
-                    if option == "leaderboard":
-                        self.state = "leaderboard"
-                    elif option == "quit":
-                        pygame.quit()
-                        sys.exit()
-                    else:
-                        self.start_game(option)
-                    break
+        handler = self._menu_dispatch.get(event.type)
+        if handler:
+            # Ensure rects exist for hit-testing
+            self._ensure_menu_buttons()
+            handler(event)
+
+    def _on_menu_motion(self, event: pygame.event.Event) -> None:
+        # Motion events can repeat the same position on high-rate mice
+        if event.pos == self._last_mouse_pos:
+            return
+        self._last_mouse_pos = event.pos
+        mx, my = event.pos
+        idx = _stack_hit(self.menu_button_rects, self._menu_base_y, self._menu_spacing, mx, my)
+        if idx >= 0:
+            self.menu_index = idx
+
+    def _on_menu_click(self, event: pygame.event.Event) -> None:
+        if event.button != 1:
+            return
+        mx, my = event.pos
+        # Top-right settings button
+        if self.menu_settings_rect and self.menu_settings_rect.collidepoint(mx, my):
+            self.settings_return_state = "menu"
+            self.state = "settings"
+            self._ensure_settings_buttons()
+            return
+        # Top-left login/logout button
+        if self.menu_login_rect and self.menu_login_rect.collidepoint(mx, my):
+            if self.session.is_logged_in:
+                self.do_logout()
+            else:
+                # Guest mode - go to login screen
+                self.state = "login"
+                if self.login_menu:
+                    self.login_menu.reset()
+            return
+        # Menu buttons
+        idx = _stack_hit(self.menu_button_rects, self._menu_base_y, self._menu_spacing, mx, my)
+        if idx < 0:
+            return
+        option = self.menu_button_rects[idx][0]
+        if option == "leaderboard":
+            self.state = "leaderboard"
+        elif option == "quit":
+            pygame.quit()
+            sys.exit()
+        else:
+            self.start_game(option)
 
     def do_logout(self) -> None:
         """Log out the current user and return to login screen."""
@@ -247,13 +598,19 @@ class ArcadeApp:
             self.snake_selection_rects.clear()
             return
         
+        self._launch_game(key)
+
+    def _launch_game(self, key: str, **kwargs) -> None:
+        """Load the game's sounds on first use, then create and start it."""
+        self.sounds.preload(_PER_GAME_SOUNDS.get(key, ()))
         GameClass = GAME_REGISTRY[key]
         # Pass user_id for score tracking (None for guests)
         user_id = self.session.user_id if self.session.is_logged_in else None
-        self.active_game = GameClass(self.screen, self.cfg, self.sounds, user_id=user_id)
+        self.active_game = GameClass(self.screen, self.cfg, self.sounds, user_id=user_id, **kwargs)
+        self._bound_display["game"] = self._display_version
         self.active_game.start()
         self.state = "game"
-    
+
     def handle_hybrid_select_event(self, event: pygame.event.Event) -> None:
         """Handle events for hybrid mode selection screen."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -266,11 +623,7 @@ class ArcadeApp:
             for key, rect in self.hybrid_selection_rects:
                 if rect.collidepoint(mx, my):
                     # Start the selected hybrid game
-                    GameClass = GAME_REGISTRY[key]
-                    user_id = self.session.user_id if self.session.is_logged_in else None
-                    self.active_game = GameClass(self.screen, self.cfg, self.sounds, user_id=user_id)
-                    self.active_game.start()
-                    self.state = "game"
+                    self._launch_game(key)
                     return
 
     def handle_snake_select_event(self, event: pygame.event.Event) -> None:
@@ -294,11 +647,7 @@ class ArcadeApp:
                         "hard": "hard"
                     }
                     self.cfg.snake_difficulty = difficulty_map.get(key, "intermediate")
-                    GameClass = GAME_REGISTRY["snake"]
-                    user_id = self.session.user_id if self.session.is_logged_in else None
-                    self.active_game = GameClass(self.screen, self.cfg, self.sounds, user_id=user_id, map_size=key)
-                    self.active_game.start()
-                    self.state = "game"
+                    self._launch_game("snake", map_size=key)
                     return
 
     def update(self, dt: float) -> None:
@@ -311,6 +660,7 @@ class ArcadeApp:
     def draw(self) -> None:
         if self.state == "login":
             if self.login_menu:
+                self._bind_display("login", self.login_menu)
                 self.login_menu.draw()
         elif self.state == "menu":
             self.draw_menu()
@@ -319,11 +669,13 @@ class ArcadeApp:
         elif self.state == "snake_select":
             self.draw_snake_select()
         elif self.state == "game" and self.active_game:
+            self._bind_display("game", self.active_game)
             self.screen.fill((10, 10, 24))
             self.active_game.draw()
             if self.paused:
                 self.draw_pause_menu()
         elif self.state == "leaderboard":
+            self._bind_display("leaderboard", self.leaderboard)
             self.screen.fill((8, 8, 16))
             self.leaderboard.draw()
         elif self.state == "settings":
@@ -333,6 +685,7 @@ class ArcadeApp:
             else:
                 self.screen.fill((10, 10, 24))
                 if self.active_game:
+                    self._bind_display("game", self.active_game)
                     self.active_game.draw()
                 # If coming from pause, keep it dimmed similarly
             self.draw_settings_menu()
@@ -347,53 +700,87 @@ class ArcadeApp:
             # Leaving fullscreen: restore windowed size
             self.cfg.fullscreen = False
             self.cfg.width, self.cfg.height = self.windowed_size
-        self.apply_display_mode()
+        # Deferred to the frame top so repeated toggles recreate the window once
+        self._pending_display_change = True
 
     def apply_display_mode(self) -> None:
         # Recreate display surface based on current cfg
         self.screen = init_pygame_window(self.cfg)
-        # Update references that draw onto the screen
-        self.leaderboard.screen = self.screen
-        if self.login_menu:
-            self.login_menu.screen = self.screen
-            self.login_menu.cfg = self.cfg
-            self.login_menu.fields_built = False  # Rebuild fields for new size
-        if self.active_game:
-            self.active_game.screen = self.screen
-            self.active_game.cfg = self.cfg
+        # Cached surfaces were converted to the old display's pixel format
+        self._text_cache.clear()
+        self._overlay_cache.clear()
+        self._chrome_cache.clear()
+        self._build_static_text()
+        self._build_backgrounds()
+        # Force button layouts to rebuild for the new size
+        self._menu_sig = self._settings_sig = self._pause_sig = None
+        if self.state == "settings":
+            self._ensure_settings_buttons()
+        if self.paused:
+            self._ensure_pause_buttons()
+        self._dirty = True
+        # Dependents pick up the new surface lazily in _bind_display
+        self._display_version += 1
+
+    def _bind_display(self, role: str, target) -> None:
+        """Point a screen-drawing dependent at the current display if it is stale."""
+        if target is None or self._bound_display[role] == self._display_version:
+            return
+        target.screen = self.screen
+        target.cfg = self.cfg
+        if role == "login":
+            target.fields_built = False  # Rebuild fields for new size
+        self._bound_display[role] = self._display_version
 
     def handle_pause_event(self, event: pygame.event.Event) -> None:
-        if not self.pause_button_rects: # if esc is pressed call the build pause buttons
-            self.build_pause_buttons()
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1: #find which button is clicked
-            mx, my = event.pos
-            for key, rect in self.pause_button_rects: # perform button actions
-                if rect.collidepoint(mx, my):
-                    if key == "resume":
-                        self.paused = False
-                    elif key == "restart":
-                        self.active_game.reset()
-                        self.paused = False
-                    elif key == "settings":
-                        self.settings_return_state = "pause"
-                        self.state = "settings"
-                    elif key == "back":
-                        self.active_game.stop()
-                        self.active_game = None
-                        self.paused = False
-                        self.state = "menu"
-                    break
+        self._ensure_pause_buttons() # if esc is pressed build the pause buttons
+        handler = self._pause_dispatch.get(event.type)
+        if handler:
+            handler(event)
+
+    def _on_pause_click(self, event: pygame.event.Event) -> None:
+        if event.button != 1:
+            return
+        mx, my = event.pos #find which button is clicked
+        idx = _stack_hit(self.pause_button_rects, self._pause_base_y, self._pause_spacing, mx, my)
+        if idx < 0:
+            return
+        key = self.pause_button_rects[idx][0] # perform button actions
+        if key == BKey.RESUME:
+            self.paused = False
+        elif key == BKey.RESTART:
+            self.active_game.reset()
+            self.paused = False
+        elif key == BKey.SETTINGS:
+            self.settings_return_state = "pause"
+            self.state = "settings"
+            self._ensure_settings_buttons()
+        elif key == BKey.BACK:
+            self.active_game.stop()
+            self.active_game = None
+            self.paused = False
+            self.state = "menu"
+
+    def _ensure_pause_buttons(self) -> None:
+        """Rebuild pause button rects only when the window size changed."""
+        sig = (self.cfg.width, self.cfg.height)
+        if sig == self._pause_sig and self.pause_button_rects:
+            return
+        self._pause_sig = sig
+        self.build_pause_buttons()
 
     def build_pause_buttons(self) -> None:
         self.pause_button_rects.clear()
-        labels = [("resume", "Resume"), ("settings", "Settings"), ("restart", "Restart"), ("back", "Back To Main Menu")]
+        labels = list(PAUSE_LABELS.items())
         spacing = 64
         padding_x, padding_y = 22, 12
         button_width = 360
         total_h = len(labels) * spacing
         start_y = self.cfg.height // 2 - total_h // 2
+        # Stack geometry for _stack_hit
+        self._pause_base_y, self._pause_spacing = start_y, spacing
         for i, (key, text) in enumerate(labels):
-            surf = self.font.render(text, True, (255, 255, 255))
+            surf = self._render(text, (255, 255, 255))
             tw, th = surf.get_size()
             w = max(button_width, tw + padding_x * 2)
             h = th + padding_y * 2
@@ -402,96 +789,101 @@ class ArcadeApp:
             self.pause_button_rects.append((key, pygame.Rect(x, y, w, h)))
 
     def draw_pause_menu(self) -> None:
-        overlay = pygame.Surface(self.cfg.screen_size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_overlay(self.cfg.screen_size, 160), (0, 0))
 
-        title = self.font.render("Paused", True, (255, 255, 255))
+        title = self._static_text["paused"]
         self.screen.blit(title, (self.cfg.width // 2 - title.get_width() // 2, self.cfg.height // 2 - 200))
 
-        self.build_pause_buttons()
         mouse_pos = pygame.mouse.get_pos()
         for key, rect in self.pause_button_rects:
-            label = {
-                "resume": "Resume",
-                "settings": "Settings",
-                "restart": "Restart",
-                "back": "Back To Main Menu",
-            }[key]
-            hovered = rect.collidepoint(*mouse_pos)
-            fill = (70, 80, 120) if hovered else (40, 45, 85)
-            border = (255, 255, 255) if hovered else (140, 150, 190)
-            pygame.draw.rect(self.screen, fill, rect, border_radius=8)
-            pygame.draw.rect(self.screen, border, rect, width=2, border_radius=8)
-            text_surf = self.font.render(label, True, (255, 255, 255))
+            label = PAUSE_LABELS[key]
+            hovered = rect.collidepoint(mouse_pos)
+            fill = BTN_FILL[hovered]
+            border = BTN_BORDER[hovered]
+            self._draw_btn(rect, fill, border, 8)
+            text_surf = self._render(label, (255, 255, 255))
             tx = rect.x + (rect.width - text_surf.get_width()) // 2
             ty = rect.y + (rect.height - text_surf.get_height()) // 2
             self.screen.blit(text_surf, (tx, ty))
 
     # ----- Settings overlay -----
     def handle_settings_event(self, event: pygame.event.Event) -> None:
-        if not self.settings_button_rects:
-            self.build_settings_buttons()
+        self._ensure_settings_buttons()
+        handler = self._settings_dispatch.get(event.type)
+        if handler:
+            handler(event)
+
+    def _on_settings_click(self, event: pygame.event.Event) -> None:
+        if event.button != 1:
+            return
+        mx, my = event.pos
+        # Check if clicking on a slider
+        for slider_key, (label_rect, slider_rect) in self.settings_slider_rects.items():
+            if slider_rect.collidepoint(mx, my):
+                self.dragging_slider = slider_key
+                self._update_slider_value(slider_key, mx, slider_rect)
+                return
         
-        # Handle slider dragging
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mx, my = event.pos
-            # Check if clicking on a slider
-            for slider_key, (label_rect, slider_rect) in self.settings_slider_rects.items():
-                if slider_rect.collidepoint(mx, my):
-                    self.dragging_slider = slider_key
-                    self._update_slider_value(slider_key, mx, slider_rect)
+        # Check buttons
+        for key, rect in self.settings_button_rects:
+            if rect.collidepoint(mx, my):
+                if key == BKey.TOGGLE_FULLSCREEN:
+                    self.toggle_fullscreen()
+                elif key == BKey.TOGGLE_MUTE:
+                    self.cfg.audio.muted = not self.cfg.audio.muted
+                    self.sounds.set_muted(self.cfg.audio.muted)
+                elif key == BKey.TOGGLE_FPS:
+                    self.cfg.show_fps = not self.cfg.show_fps
+                elif key in DIFFICULTY_BY_KEY:
+                    level = DIFFICULTY_BY_KEY[key]
+                    self.cfg.difficulty = level
+                    set_difficulty(level)
+                elif key == BKey.BACK:
+                    self.dragging_slider = None
+                    if self.settings_return_state == "menu":
+                        self.state = "menu"
+                    else:
+                        self.state = "game"
+                        self.paused = True
+                        self._ensure_pause_buttons()
                     return
-            
-            # Check buttons
-            for key, rect in self.settings_button_rects:
-                if rect.collidepoint(mx, my):
-                    if key == "toggle_fullscreen":
-                        self.toggle_fullscreen()
-                        self.settings_button_rects.clear()
-                        self.settings_slider_rects.clear()
-                    elif key == "toggle_mute":
-                        self.cfg.audio.muted = not self.cfg.audio.muted
-                        self.sounds.set_muted(self.cfg.audio.muted)
-                    elif key == "toggle_fps":
-                        self.cfg.show_fps = not self.cfg.show_fps
-                    elif key == "difficulty_easy":
-                        self.cfg.difficulty = "easy"
-                        set_difficulty("easy")
-                    elif key == "difficulty_intermediate":
-                        self.cfg.difficulty = "intermediate"
-                        set_difficulty("intermediate")
-                    elif key == "difficulty_hard":
-                        self.cfg.difficulty = "hard"
-                        set_difficulty("hard")
-                    elif key == "back":
-                        self.dragging_slider = None
-                        if self.settings_return_state == "menu":
-                            self.state = "menu"
-                        else:
-                            self.state = "game"
-                            self.paused = True
-                    break
-        
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                break
+        # Toggles change labels/highlights; rebuild now rather than in draw
+        self._ensure_settings_buttons()
+
+    def _on_settings_release(self, event: pygame.event.Event) -> None:
+        if event.button == 1:
             self.dragging_slider = None
-        
-        elif event.type == pygame.MOUSEMOTION and self.dragging_slider:
+
+    def _on_settings_motion(self, event: pygame.event.Event) -> None:
+        if self.dragging_slider and self.dragging_slider in self.settings_slider_rects:
             mx, my = event.pos
-            if self.dragging_slider in self.settings_slider_rects:
-                _, slider_rect = self.settings_slider_rects[self.dragging_slider]
-                self._update_slider_value(self.dragging_slider, mx, slider_rect)
+            _, slider_rect = self.settings_slider_rects[self.dragging_slider]
+            self._update_slider_value(self.dragging_slider, mx, slider_rect)
 
-    def _update_slider_value(self, slider_key: str, mouse_x: int, slider_rect: pygame.Rect) -> None:
+    def _update_slider_value(self, slider_key: BKey, mouse_x: int, slider_rect: pygame.Rect) -> None:
         """Update a slider value based on mouse position."""
-        # Calculate value (0.0 to 1.0)
-        relative_x = mouse_x - slider_rect.x
-        value = max(0.0, min(1.0, relative_x / slider_rect.width))
+        value = _slider_fraction(mouse_x, slider_rect.x, slider_rect.width)
         
-        if slider_key == "sfx_volume":
+        if slider_key == BKey.SFX_SLIDER:
+            # Drags emit many motion events past either end of the track; skip
+            # re-applying the volume to every loaded sound when nothing changed
+            if value == self.cfg.audio.sfx_volume:
+                return
             self.cfg.audio.sfx_volume = value
             self.sounds.set_volume(value)
 
+    def _ensure_settings_buttons(self) -> None:
+        """Rebuild settings rects only when size or a setting that affects labels changed.
+
+        Slider geometry does not depend on the slider value, only its fill width does.
+        """
+        sig = (self.cfg.width, self.cfg.height, self.cfg.audio.muted, self.cfg.show_fps, self.cfg.difficulty)
+        if sig == self._settings_sig and self.settings_button_rects:
+            return
+        self._settings_sig = sig
+        self.build_settings_buttons()
+
     def build_settings_buttons(self) -> None:
         self.settings_button_rects.clear()
         self.settings_slider_rects.clear()
@@ -505,11 +897,11 @@ class ArcadeApp:
         
         # Sliders for volume
         sliders = [
-            ("sfx_volume", "SFX Volume", self.cfg.audio.sfx_volume),
+            (BKey.SFX_SLIDER, "SFX Volume", self.cfg.audio.sfx_volume),
         ]
         
         for key, label, value in sliders:
-            label_surf = self.font.render(label, True, (255, 255, 255))
+            label_surf = self._render(label, (255, 255, 255))
             label_rect = pygame.Rect(
                 self.cfg.width // 2 - 200,
                 current_y,
@@ -527,42 +919,38 @@ class ArcadeApp:
         
         # Mute button
         mute_label = "Unmute" if self.cfg.audio.muted else "Mute"
-        mute_surf = self.font.render(mute_label, True, (255, 255, 255))
+        mute_surf = self._render(mute_label, (255, 255, 255))
         mute_w = max(150, mute_surf.get_width() + padding_x * 2)
         mute_h = mute_surf.get_height() + padding_y * 2
         self.settings_button_rects.append((
-            "toggle_mute",
+            BKey.TOGGLE_MUTE,
             pygame.Rect(self.cfg.width // 2 - mute_w // 2, current_y, mute_w, mute_h)
         ))
         current_y += spacing
         
         # Show FPS button
         fps_label = "Hide FPS" if self.cfg.show_fps else "Show FPS"
-        fps_surf = self.font.render(fps_label, True, (255, 255, 255))
+        fps_surf = self._render(fps_label, (255, 255, 255))
         fps_w = max(150, fps_surf.get_width() + padding_x * 2)
         fps_h = fps_surf.get_height() + padding_y * 2
         self.settings_button_rects.append((
-            "toggle_fps",
+            BKey.TOGGLE_FPS,
             pygame.Rect(self.cfg.width // 2 - fps_w // 2, current_y, fps_w, fps_h)
         ))
         current_y += spacing + 10
         
         # Difficulty selection
-        diff_label = self.font.render("Difficulty:", True, (255, 255, 255))
+        diff_label = self._static_text["difficulty_label"]
         self._diff_label_y = current_y
         current_y += diff_label.get_height() + 10
         
         # Difficulty buttons in a row
-        diff_buttons = [
-            ("difficulty_easy", "Easy"),
-            ("difficulty_intermediate", "Normal"),
-            ("difficulty_hard", "Hard"),
-        ]
+        diff_buttons = [BKey.DIFF_EASY, BKey.DIFF_INT, BKey.DIFF_HARD]
         button_w = 100
         total_w = len(diff_buttons) * button_w + (len(diff_buttons) - 1) * 10
         start_x = self.cfg.width // 2 - total_w // 2
         
-        for i, (key, label) in enumerate(diff_buttons):
+        for i, key in enumerate(diff_buttons):
             btn_rect = pygame.Rect(
                 start_x + i * (button_w + 10),
                 current_y,
@@ -574,9 +962,8 @@ class ArcadeApp:
         current_y += spacing + 20
         
         # Fullscreen and Back buttons
-        other_buttons = [("toggle_fullscreen", "Toggle Fullscreen"), ("back", "Back")]
-        for key, text in other_buttons:
-            surf = self.font.render(text, True, (255, 255, 255))
+        for key in (BKey.TOGGLE_FULLSCREEN, BKey.BACK):
+            surf = self._render(SETTINGS_LABELS[key], (255, 255, 255))
             tw, th = surf.get_size()
             w = max(button_width, tw + padding_x * 2)
             h = th + padding_y * 2
@@ -585,16 +972,12 @@ class ArcadeApp:
             current_y += spacing
 
     def draw_settings_menu(self) -> None:
-        overlay = pygame.Surface(self.cfg.screen_size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_overlay(self.cfg.screen_size, 180), (0, 0))
 
         # Title
-        title = self.font.render("Settings", True, (255, 255, 255))
+        title = self._static_text["settings_title"]
         self.screen.blit(title, (self.cfg.width // 2 - title.get_width() // 2, self.cfg.height // 2 - 220))
 
-        # Build/update UI elements
-        self.build_settings_buttons()
         mouse_pos = pygame.mouse.get_pos()
         
         # Draw sliders
@@ -603,12 +986,11 @@ class ArcadeApp:
             label = "SFX Volume"
             value = self.cfg.audio.sfx_volume
             
-            label_surf = self.font.render(label, True, (255, 255, 255))
+            label_surf = self._render(label, (255, 255, 255))
             self.screen.blit(label_surf, (label_rect.x, label_rect.y))
             
             # Draw slider background
-            pygame.draw.rect(self.screen, (60, 60, 80), slider_rect, border_radius=4)
-            pygame.draw.rect(self.screen, (100, 110, 140), slider_rect, 2, border_radius=4)
+            self._draw_btn(slider_rect, (60, 60, 80), (100, 110, 140), 4)
             
             # Draw slider fill
             fill_width = int(slider_rect.width * value)
@@ -622,40 +1004,29 @@ class ArcadeApp:
             pygame.draw.rect(self.screen, (255, 255, 255), handle_rect, border_radius=3)
             
             # Draw percentage
-            pct_text = self.font.render(f"{int(value * 100)}%", True, (200, 200, 200))
+            pct_text = self._render(f"{int(value * 100)}%", (200, 200, 200))
             self.screen.blit(pct_text, (slider_rect.right + 15, slider_rect.y - 5))
         
         # Draw difficulty label
-        diff_label = self.font.render("Difficulty:", True, (255, 255, 255))
+        diff_label = self._static_text["difficulty_label"]
         diff_y = getattr(self, '_diff_label_y', self.cfg.height // 2 + 40)
         self.screen.blit(diff_label, (self.cfg.width // 2 - diff_label.get_width() // 2, diff_y))
         
         # Draw buttons
         for key, rect in self.settings_button_rects:
             # Determine label text
-            if key == "toggle_fullscreen":
-                label = "Toggle Fullscreen"
-            elif key == "toggle_mute":
+            if key == BKey.TOGGLE_MUTE:
                 label = "Unmute" if self.cfg.audio.muted else "Mute"
-            elif key == "toggle_fps":
+            elif key == BKey.TOGGLE_FPS:
                 label = "Hide FPS" if self.cfg.show_fps else "Show FPS"
-            elif key == "back":
-                label = "Back"
-            elif key == "difficulty_easy":
-                label = "Easy"
-            elif key == "difficulty_intermediate":
-                label = "Normal"
-            elif key == "difficulty_hard":
-                label = "Hard"
             else:
-                label = key
+                label = SETTINGS_LABELS[key]
             
-            hovered = rect.collidepoint(*mouse_pos)
+            hovered = rect.collidepoint(mouse_pos)
             
             # Special styling for difficulty buttons
-            if key.startswith("difficulty_"):
-                diff_level = key.replace("difficulty_", "")
-                is_selected = self.cfg.difficulty == diff_level
+            if key in DIFFICULTY_BY_KEY:
+                is_selected = self.cfg.difficulty == DIFFICULTY_BY_KEY[key]
                 if is_selected:
                     fill = (80, 140, 80)  # Green for selected
                     border = (120, 200, 120)
@@ -666,22 +1037,31 @@ class ArcadeApp:
                     fill = (40, 45, 85)
                     border = (140, 150, 190)
             else:
-                fill = (70, 80, 120) if hovered else (40, 45, 85)
-                border = (255, 255, 255) if hovered else (140, 150, 190)
+                fill = BTN_FILL[hovered]
+                border = BTN_BORDER[hovered]
             
-            pygame.draw.rect(self.screen, fill, rect, border_radius=8)
-            pygame.draw.rect(self.screen, border, rect, width=2, border_radius=8)
-            text_surf = self.font.render(label, True, (255, 255, 255))
+            self._draw_btn(rect, fill, border, 8)
+            text_surf = self._render(label, (255, 255, 255))
             tx = rect.x + (rect.width - text_surf.get_width()) // 2
             ty = rect.y + (rect.height - text_surf.get_height()) // 2
             self.screen.blit(text_surf, (tx, ty))
 
     # ----- Menu drawing with top-right settings button -----
+    def _ensure_menu_buttons(self) -> None:
+        """Rebuild menu rects only when window size or login state changed."""
+        sig = (self.cfg.width, self.cfg.height, self.session.is_logged_in)
+        if sig == self._menu_sig and self.menu_button_rects:
+            return
+        self._menu_sig = sig
+        self.build_menu_buttons()
+        self.menu_settings_rect = self.build_menu_settings_button()
+        self.menu_login_rect = self.build_menu_login_button()
+
     def build_menu_settings_button(self) -> pygame.Rect:
         # Size and position for top-right settings button
         padding = 14
         label = "Settings"
-        text_surf = self.font.render(label, True, (255, 255, 255))
+        text_surf = self._render(label, (255, 255, 255))
         tw, th = text_surf.get_size()
         w, h = max(140, tw + 24), th + 14
         x = self.cfg.width - w - padding
@@ -693,7 +1073,7 @@ class ArcadeApp:
         padding = 14
         # Show "Logout" if logged in, "Login" if guest
         label = "Logout" if self.session.is_logged_in else "Login"
-        text_surf = self.font.render(label, True, (255, 255, 255))
+        text_surf = self._render(label, (255, 255, 255))
         tw, th = text_surf.get_size()
         w, h = max(140, tw + 24), th + 14
         x = padding
@@ -701,128 +1081,99 @@ class ArcadeApp:
         return pygame.Rect(x, y, w, h)
 
     def draw_menu(self) -> None:
-        self.screen.fill((20, 20, 50))
-        title = self.font.render("Retro Arcade Game", True, (255, 255, 255))
-        self.screen.blit(title, (self.cfg.width // 2 - title.get_width() // 2, 60))
+        self.screen.blit(self._menu_bg, (0, 0))
         
         # Show logged-in user info
         if self.username:
             user_text = f"Welcome, {self.username}!"
-            user_surf = self.font.render(user_text, True, (150, 200, 150))
+            user_surf = self._render(user_text, (150, 200, 150))
             self.screen.blit(user_surf, (self.cfg.width // 2 - user_surf.get_width() // 2, 110))
 
-        # Rebuild each frame to adapt to window size/font metrics
-        self.build_menu_buttons()
+        # Rebuild only when window size/login state changed
+        self._ensure_menu_buttons()
         mouse_pos = pygame.mouse.get_pos()
 
         for idx, (option, rect) in enumerate(self.menu_button_rects):
             label = option.replace("_", " ").title()
-            text_surf = self.font.render(label, True, (255, 255, 255))
+            text_surf = self._render(label, (255, 255, 255))
             text_w, text_h = text_surf.get_size()
 
-            hovered = rect.collidepoint(*mouse_pos)
+            hovered = rect.collidepoint(mouse_pos)
             if hovered:
                 self.menu_index = idx
 
-            fill_color = (60, 70, 120) if hovered else (35, 40, 80)
-            border_color = (255, 255, 255) if hovered else (120, 130, 180)
+            fill_color = MENU_BTN_FILL[hovered]
+            border_color = MENU_BTN_BORDER[hovered]
 
-            pygame.draw.rect(self.screen, fill_color, rect, border_radius=8)
-            pygame.draw.rect(self.screen, border_color, rect, width=2, border_radius=8)
+            self._draw_btn(rect, fill_color, border_color, 8)
 
             text_x = rect.x + (rect.width - text_w) // 2
             text_y = rect.y + (rect.height - text_h) // 2
             self.screen.blit(text_surf, (text_x, text_y))
 
-        # Draw or update menu settings button (top-right)
-        self.menu_settings_rect = self.build_menu_settings_button()
-        hovered = self.menu_settings_rect.collidepoint(*pygame.mouse.get_pos())
-        fill = (70, 80, 120) if hovered else (40, 45, 85)
-        border = (255, 255, 255) if hovered else (140, 150, 190)
-        pygame.draw.rect(self.screen, fill, self.menu_settings_rect, border_radius=8)
-        pygame.draw.rect(self.screen, border, self.menu_settings_rect, width=2, border_radius=8)
-        text = self.font.render("Settings", True, (255, 255, 255))
+        # Draw menu settings button (top-right)
+        hovered = self.menu_settings_rect.collidepoint(mouse_pos)
+        fill = BTN_FILL[hovered]
+        border = BTN_BORDER[hovered]
+        self._draw_btn(self.menu_settings_rect, fill, border, 8)
+        text = self._static_text["settings_button"]
         tx = self.menu_settings_rect.x + (self.menu_settings_rect.width - text.get_width()) // 2
         ty = self.menu_settings_rect.y + (self.menu_settings_rect.height - text.get_height()) // 2
         self.screen.blit(text, (tx, ty))
 
         # Draw login/logout button (top-left)
-        self.menu_login_rect = self.build_menu_login_button()
         login_label = "Logout" if self.session.is_logged_in else "Login"
-        hovered = self.menu_login_rect.collidepoint(*pygame.mouse.get_pos())
-        fill = (70, 80, 120) if hovered else (40, 45, 85)
-        border = (255, 255, 255) if hovered else (140, 150, 190)
-        pygame.draw.rect(self.screen, fill, self.menu_login_rect, border_radius=8)
-        pygame.draw.rect(self.screen, border, self.menu_login_rect, width=2, border_radius=8)
-        text = self.font.render(login_label, True, (255, 255, 255))
+        hovered = self.menu_login_rect.collidepoint(mouse_pos)
+        fill = BTN_FILL[hovered]
+        border = BTN_BORDER[hovered]
+        self._draw_btn(self.menu_login_rect, fill, border, 8)
+        text = self._render(login_label, (255, 255, 255))
         tx = self.menu_login_rect.x + (self.menu_login_rect.width - text.get_width()) // 2
         ty = self.menu_login_rect.y + (self.menu_login_rect.height - text.get_height()) // 2
         self.screen.blit(text, (tx, ty))
 
     def draw_snake_select(self) -> None:
         """Draw the snake map size selection screen."""
-        self.screen.fill((20, 50, 30))  # Green-tinted background for Snake theme
-        
-        # Title
-        title_font = pygame.font.SysFont("arial", 36)
-        title = title_font.render("Select Snake Map Size", True, (255, 255, 255))
-        self.screen.blit(title, (self.cfg.width // 2 - title.get_width() // 2, 60))
-        
-        # Subtitle
-        subtitle = self.font.render("Choose your preferred difficulty level", True, (180, 220, 180))
-        self.screen.blit(subtitle, (self.cfg.width // 2 - subtitle.get_width() // 2, 110))
+        # Background, title, subtitle and footer note are pre-rendered
+        self.screen.blit(self._snake_bg, (0, 0))
         
         # Build selection cards in horizontal layout
         self.snake_selection_rects.clear()
-        card_width = 200
-        card_height = 200
-        h_spacing = 30  # Horizontal spacing between cards
-        
-        # Calculate grid dimensions for 3 cards in a row
-        total_width = len(SNAKE_MAP_OPTIONS) * card_width + (len(SNAKE_MAP_OPTIONS) - 1) * h_spacing
-        start_x = self.cfg.width // 2 - total_width // 2
-        start_y = 170
+        card_width, card_height = SNAKE_CARD_SIZE
+        layout = _snake_layout(self.cfg.width, len(SNAKE_MAP_OPTIONS))
+        start_y = SNAKE_CARD_TOP
         
         mouse_pos = pygame.mouse.get_pos()
-        small_font = pygame.font.SysFont("arial", 14)
-        size_font = pygame.font.SysFont("arial", 18)
-        
-        # Difficulty colors
-        difficulty_colors = {
-            "easy": (100, 200, 100),    # Green for easy
-            "normal": (200, 200, 100),  # Yellow for normal
-            "hard": (200, 100, 100),    # Red for hard
-        }
+        small_font = self.note_font
+        size_font = self.label_font
         
         for i, (key, name, size_desc, effect_desc) in enumerate(SNAKE_MAP_OPTIONS):
-            card_x = start_x + i * (card_width + h_spacing)
-            card_y = start_y
-            card_rect = pygame.Rect(card_x, card_y, card_width, card_height)
+            card_x, card_y = layout[i][0], layout[i][1]
+            card_rect = pygame.Rect(layout[i])
             self.snake_selection_rects.append((key, card_rect))
             
-            hovered = card_rect.collidepoint(*mouse_pos)
+            hovered = card_rect.collidepoint(mouse_pos)
             is_selected = key == self.selected_snake_map
             
             # Card background with difficulty-themed border
-            fill = (40, 70, 50) if hovered else (30, 50, 40)
-            border_color = difficulty_colors.get(key, (150, 180, 150))
+            fill = SNAKE_CARD_FILL[hovered]
+            name_color = SNAKE_DIFFICULTY_COLORS[i]
+            border_color = name_color
             if hovered:
                 border_color = (255, 255, 255)
-            pygame.draw.rect(self.screen, fill, card_rect, border_radius=12)
-            pygame.draw.rect(self.screen, border_color, card_rect, width=3 if hovered or is_selected else 2, border_radius=12)
+            self._draw_btn(card_rect, fill, border_color, 12, 3 if hovered or is_selected else 2)
             
             # Difficulty name with color coding
-            name_color = difficulty_colors.get(key, (255, 255, 255))
-            mode_name = pygame.font.SysFont("arial", 28).render(name, True, name_color)
+            mode_name = self._render(name, name_color)
             self.screen.blit(mode_name, (card_x + card_width // 2 - mode_name.get_width() // 2, card_y + 15))
             
             # Map size description (smaller font to fit)
-            size_surf = size_font.render(size_desc, True, (255, 255, 255))
+            size_surf = self._render_cached(size_font, size_desc, (255, 255, 255))
             self.screen.blit(size_surf, (card_x + card_width // 2 - size_surf.get_width() // 2, card_y + 55))
             
             # Effect description
-            desc_color = (180, 220, 180) if hovered else (150, 180, 150)
-            effect_surf = small_font.render(effect_desc, True, desc_color)
+            desc_color = SNAKE_DESC_COLOR[hovered]
+            effect_surf = self._render_cached(small_font, effect_desc, desc_color)
             self.screen.blit(effect_surf, (card_x + card_width // 2 - effect_surf.get_width() // 2, card_y + 85))
             
             # Visual map preview (simple grid representation)
@@ -839,15 +1190,13 @@ class ArcadeApp:
             preview_width = grid_cols * cell_size
             preview_height = grid_rows * cell_size
             preview_rect = pygame.Rect(preview_x - preview_width // 2, preview_y, preview_width, preview_height)
-            pygame.draw.rect(self.screen, (100, 160, 100), preview_rect)
-            pygame.draw.rect(self.screen, border_color, preview_rect, width=1)
+            self._draw_btn(preview_rect, (100, 160, 100), border_color, 0, 1)
             
             # Select button
             btn_rect = pygame.Rect(card_x + card_width // 2 - 45, card_y + card_height - 35, 90, 28)
-            btn_fill = (60, 120, 80) if hovered else (40, 80, 50)
-            pygame.draw.rect(self.screen, btn_fill, btn_rect, border_radius=6)
-            pygame.draw.rect(self.screen, (150, 200, 150), btn_rect, width=2, border_radius=6)
-            select_text = small_font.render("Play", True, (255, 255, 255))
+            btn_fill = SNAKE_PLAY_FILL[hovered]
+            self._draw_btn(btn_rect, btn_fill, (150, 200, 150), 6)
+            select_text = self._render_cached(small_font, "Play", (255, 255, 255))
             self.screen.blit(select_text, (btn_rect.centerx - select_text.get_width() // 2,
                                            btn_rect.centery - select_text.get_height() // 2))
         
@@ -860,90 +1209,62 @@ class ArcadeApp:
             back_width,
             back_height
         )
-        hovered = self.snake_back_rect.collidepoint(*mouse_pos)
-        fill = (60, 90, 70) if hovered else (40, 60, 50)
-        border = (255, 255, 255) if hovered else (120, 150, 130)
-        pygame.draw.rect(self.screen, fill, self.snake_back_rect, border_radius=8)
-        pygame.draw.rect(self.screen, border, self.snake_back_rect, width=2, border_radius=8)
-        back_text = self.font.render("Back to Menu", True, (255, 255, 255))
+        hovered = self.snake_back_rect.collidepoint(mouse_pos)
+        fill = SNAKE_BACK_FILL[hovered]
+        border = SNAKE_BACK_BORDER[hovered]
+        self._draw_btn(self.snake_back_rect, fill, border, 8)
+        back_text = self._static_text["back_to_menu"]
         self.screen.blit(back_text, (self.snake_back_rect.centerx - back_text.get_width() // 2,
                                      self.snake_back_rect.centery - back_text.get_height() // 2))
-        
-        # Examiner justification note at bottom
-        note_font = pygame.font.SysFont("arial", 14)
-        note = note_font.render(
-            "Map variety increases replayability and allows players of different skill levels to tailor the challenge.",
-            True, (120, 150, 130)
-        )
-        self.screen.blit(note, (self.cfg.width // 2 - note.get_width() // 2, self.cfg.height - 40))
 
     def draw_hybrid_select(self) -> None:
         """Draw the hybrid mode selection screen."""
-        self.screen.fill((20, 20, 50))
-        
-        # Title
-        title_font = pygame.font.SysFont("arial", 36)
-        title = title_font.render("Select Hybrid Mode", True, (255, 255, 255))
-        self.screen.blit(title, (self.cfg.width // 2 - title.get_width() // 2, 60))
-        
-        # Subtitle
-        subtitle = self.font.render("Only one hybrid mode can be active at a time", True, (180, 180, 200))
-        self.screen.blit(subtitle, (self.cfg.width // 2 - subtitle.get_width() // 2, 110))
+        # Background, title, subtitle and footer note are pre-rendered
+        self.screen.blit(self._hybrid_bg, (0, 0))
         
         # Build selection cards in a 2-column grid layout
         self.hybrid_selection_rects.clear()
-        card_width = 320
-        card_height = 140
-        h_spacing = 40  # Horizontal spacing between columns
-        v_spacing = 30  # Vertical spacing between rows
-        cols = 2
-        
-        # Calculate grid dimensions
-        total_width = cols * card_width + (cols - 1) * h_spacing
-        start_x = self.cfg.width // 2 - total_width // 2
-        start_y = 160
+        card_width, card_height = HYBRID_CARD_SIZE
+        v_spacing = HYBRID_CARD_SPACING[1]
+        layout = _hybrid_layout(self.cfg.width, len(HYBRID_MODES))
+        start_y = HYBRID_CARD_TOP
         
         mouse_pos = pygame.mouse.get_pos()
-        small_font = pygame.font.SysFont("arial", 18)
+        small_font = self.label_font
         
         max_row = 0
         for i, (key, name, description) in enumerate(HYBRID_MODES):
-            row = i // cols
-            col = i % cols
-            max_row = max(max_row, row)
+            max_row = max(max_row, i // HYBRID_COLUMNS)
             
-            card_x = start_x + col * (card_width + h_spacing)
-            card_y = start_y + row * (card_height + v_spacing)
-            card_rect = pygame.Rect(card_x, card_y, card_width, card_height)
+            card_x, card_y = layout[i][0], layout[i][1]
+            card_rect = pygame.Rect(layout[i])
             self.hybrid_selection_rects.append((key, card_rect))
             
-            hovered = card_rect.collidepoint(*mouse_pos)
+            hovered = card_rect.collidepoint(mouse_pos)
             
             # Card background
-            fill = (50, 60, 100) if hovered else (35, 40, 80)
-            border = (255, 255, 255) if hovered else (100, 120, 180)
-            pygame.draw.rect(self.screen, fill, card_rect, border_radius=12)
-            pygame.draw.rect(self.screen, border, card_rect, width=3, border_radius=12)
+            fill = HYBRID_CARD_FILL[hovered]
+            border = HYBRID_CARD_BORDER[hovered]
+            self._draw_btn(card_rect, fill, border, 12, 3)
             
             # Mode number
-            mode_num = self.font.render(f"Hybrid Mode {i + 1}", True, (150, 180, 255))
+            mode_num = self._render(f"Hybrid Mode {i + 1}", (150, 180, 255))
             self.screen.blit(mode_num, (card_x + 15, card_y + 12))
             
             # Mode name
-            mode_name = self.font.render(name, True, (255, 255, 255))
+            mode_name = self._render(name, (255, 255, 255))
             self.screen.blit(mode_name, (card_x + 15, card_y + 45))
             
             # Description
-            desc_color = (200, 220, 255) if hovered else (150, 170, 200)
-            desc_surf = small_font.render(f'"{description}"', True, desc_color)
+            desc_color = HYBRID_DESC_COLOR[hovered]
+            desc_surf = self._render_cached(small_font, f'"{description}"', desc_color)
             self.screen.blit(desc_surf, (card_x + 15, card_y + 80))
             
             # Select button
             btn_rect = pygame.Rect(card_x + card_width // 2 - 50, card_y + card_height - 35, 100, 28)
-            btn_fill = (70, 100, 150) if hovered else (50, 70, 110)
-            pygame.draw.rect(self.screen, btn_fill, btn_rect, border_radius=6)
-            pygame.draw.rect(self.screen, (180, 200, 255), btn_rect, width=2, border_radius=6)
-            select_text = small_font.render("Select", True, (255, 255, 255))
+            btn_fill = HYBRID_SELECT_FILL[hovered]
+            self._draw_btn(btn_rect, btn_fill, (180, 200, 255), 6)
+            select_text = self._render_cached(small_font, "Select", (255, 255, 255))
             self.screen.blit(select_text, (btn_rect.centerx - select_text.get_width() // 2,
                                            btn_rect.centery - select_text.get_height() // 2))
         
@@ -957,22 +1278,13 @@ class ArcadeApp:
             back_width,
             back_height
         )
-        hovered = self.hybrid_back_rect.collidepoint(*mouse_pos)
-        fill = (70, 80, 120) if hovered else (40, 45, 85)
-        border = (255, 255, 255) if hovered else (140, 150, 190)
-        pygame.draw.rect(self.screen, fill, self.hybrid_back_rect, border_radius=8)
-        pygame.draw.rect(self.screen, border, self.hybrid_back_rect, width=2, border_radius=8)
-        back_text = self.font.render("Back to Menu", True, (255, 255, 255))
+        hovered = self.hybrid_back_rect.collidepoint(mouse_pos)
+        fill = BTN_FILL[hovered]
+        border = BTN_BORDER[hovered]
+        self._draw_btn(self.hybrid_back_rect, fill, border, 8)
+        back_text = self._static_text["back_to_menu"]
         self.screen.blit(back_text, (self.hybrid_back_rect.centerx - back_text.get_width() // 2,
                                      self.hybrid_back_rect.centery - back_text.get_height() // 2))
-        
-        # Examiner justification note at bottom
-        note_font = pygame.font.SysFont("arial", 14)
-        note = note_font.render(
-            "Each hybrid activates a predefined configuration ensuring mechanical compatibility.",
-            True, (120, 130, 160)
-        )
-        self.screen.blit(note, (self.cfg.width // 2 - note.get_width() // 2, self.cfg.height - 40))
 
     def build_menu_buttons(self) -> None:
         # Compute and cache menu button rects for mouse hit-testing
@@ -982,9 +1294,11 @@ class ArcadeApp:
         padding_x = 18
         padding_y = 10
         button_width = 320
+        # Stack geometry for _stack_hit
+        self._menu_base_y, self._menu_spacing = base_y, spacing
         for idx, option in enumerate(MENU_OPTIONS):
             label = option.replace("_", " ").title()
-            text_surf = self.font.render(label, True, (255, 255, 255))
+            text_surf = self._render(label, (255, 255, 255))
             tw, th = text_surf.get_size()
             btn_w = max(button_width, tw + padding_x * 2)
             btn_h = th + padding_y * 2
@@ -14,6 +14,12 @@ DATA_DIR = BASE_DIR / "data"
 # Load environment variables from .env file
 load_dotenv(BASE_DIR / ".env")
 
+# Headless mode for CI and benchmarks: SDL reads the driver at display init,
+# so setting it here (before pygame.init) is early enough
+HEADLESS = bool(os.getenv("RETROARCADE_HEADLESS"))
+if HEADLESS:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
 # Type alias for difficulty
 DifficultyLevel = Literal["easy", "intermediate", "hard"]
 
@@ -91,6 +97,8 @@ def init_pygame_window(cfg: Settings) -> pygame.Surface:
     screen = pygame.display.set_mode(size, flags)
     if cfg.fullscreen:
         cfg.width, cfg.height = screen.get_size()
-    # Enable key repeat so holding keys (e.g., W/A/S/D) keeps moving
-    pygame.key.set_repeat(cfg.key_repeat_delay, cfg.key_repeat_interval)
+    # Enable key repeat so holding keys (e.g., W/A/S/D) keeps moving;
+    # pointless without a real keyboard on the dummy driver
+    if os.environ.get("SDL_VIDEODRIVER") != "dummy":
+        pygame.key.set_repeat(cfg.key_repeat_delay, cfg.key_repeat_interval)
     return screen
@@ -1,40 +1,216 @@
 from __future__ import annotations
-from heapq import heappush, heappop
-from typing import Dict, List, Tuple, Optional, Iterable
+from array import array
+from functools import lru_cache
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Tuple
 
 Grid = List[List[int]]
 Node = Tuple[int, int]
 
-def heuristic(a: Node, b: Node) -> int:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-def neighbors(node: Node, grid: Grid) -> Iterable[Node]:
-    x, y = node
-    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-        nx, ny = x + dx, y + dy
-        if 0 <= ny < len(grid) and 0 <= nx < len(grid[0]) and grid[ny][nx] == 0:
-            yield (nx, ny)
-
-def astar(start: Node, goal: Node, grid: Grid) -> Optional[List[Node]]:
-    open_set: List[Tuple[int, Node]] = []
-    heappush(open_set, (0, start))
-    came_from: Dict[Node, Optional[Node]] = {start: None}
-    g_score: Dict[Node, int] = {start: 0}
-
-    while open_set:
-        _, current = heappop(open_set)
-        if current == goal:
+INF = 1 << 30
+
+# Obstacle maps keyed by id(grid): (grid, W, H, blocked, token). The grid itself
+# is kept so its id cannot be reused while the entry lives; the token is unique
+# per entry and keys the path memo, so a rebuilt or evicted map never serves
+# stale paths.
+_GRID_CACHE_SIZE = 16
+_grid_cache: Dict[int, Tuple[Grid, int, int, bytearray, int]] = {}
+_maps_by_token: Dict[int, Tuple[int, int, bytearray]] = {}
+_tokens = count()
+
+# Search buffers reused across calls while the grid shape stays the same.
+# Not thread-safe: pathfinding only runs on the game thread.
+_scratch: Dict[str, object] = {"shape": None}
+
+def _scratch_buffers(W: int, H: int) -> Tuple[array, array, bytearray, List[List[int]]]:
+    """Reset and return (g, came_from, closed, buckets) sized for a W x H grid."""
+    if _scratch["shape"] != (W, H):
+        size = W * H
+        _scratch.update(
+            shape=(W, H),
+            g=array("i", [INF]) * size,
+            came=array("i", [-1]) * size,
+            closed=bytearray(size),
+            # Pristine copies to reset from with a single C-level slice copy
+            g_init=array("i", [INF]) * size,
+            came_init=array("i", [-1]) * size,
+            closed_init=bytes(size),
+            buckets=[],
+        )
+    else:
+        _scratch["g"][:] = _scratch["g_init"]
+        _scratch["came"][:] = _scratch["came_init"]
+        _scratch["closed"][:] = _scratch["closed_init"]
+        for bucket in _scratch["buckets"]:
+            bucket.clear()
+    return _scratch["g"], _scratch["came"], _scratch["closed"], _scratch["buckets"]
+
+def heuristic(a: Node, b: Node, *, weight: float = 1.0) -> int:
+    # Manhattan distance; weight > 1 over-estimates (weighted A*): far fewer
+    # expansions on open maps, paths may no longer be the shortest
+    d = abs(a[0] - b[0]) + abs(a[1] - b[1])
+    return d if weight == 1.0 else int(weight * d)
+
+def blocked_copy(grid: Grid, cells: Iterable[Node]) -> Grid:
+    """Copy of grid with the given (x, y) cells marked as walls."""
+    out = [row[:] for row in grid]
+    for x, y in cells:
+        if 0 <= y < len(out) and 0 <= x < len(out[0]):
+            out[y][x] = 1
+    return out
+
+class MazeGrids:
+    """Pathing grids derived from one parsed maze.
+
+    eyes blocks tunnels (actors wrap through them manually), ghost also blocks
+    the house. Both are built once, so astar()'s per-grid caches keep hitting.
+    """
+
+    def __init__(self, grid: Grid, tunnels: Iterable[Node], house: Iterable[Node]):
+        self.source = grid
+        self.house = tuple(house)
+        self.eyes = blocked_copy(grid, tunnels)
+        self.ghost = blocked_copy(self.eyes, self.house)
+        self._caged: Dict[Tuple[Node, ...], Grid] = {}
+
+    def caged(self, start: Node, goal: Node) -> Grid:
+        """Eyes grid with every house tile blocked except start and goal."""
+        blocked = tuple(p for p in self.house if p not in (start, goal))
+        grid = self._caged.get(blocked)
+        if grid is None:
+            # Few house tiles, so only a handful of variants ever exist
+            grid = self._caged[blocked] = blocked_copy(self.eyes, blocked)
+        return grid
+
+_MAZE_CACHE_SIZE = 4
+_maze_cache: Dict[int, MazeGrids] = {}
+
+def maze_grids(grid: Grid, tunnels: Iterable[Node], house: Iterable[Node]) -> MazeGrids:
+    """Shared MazeGrids for a parsed maze grid (keyed by the grid object)."""
+    maze = _maze_cache.get(id(grid))
+    if maze is None or maze.source is not grid:
+        if len(_maze_cache) >= _MAZE_CACHE_SIZE:
+            del _maze_cache[next(iter(_maze_cache))]
+        maze = _maze_cache[id(grid)] = MazeGrids(grid, tunnels, house)
+    return maze
+
+def invalidate_grid(grid: Grid) -> None:
+    """Forget the cached obstacle map and paths for a grid that was mutated in place."""
+    entry = _grid_cache.pop(id(grid), None)
+    if entry is not None:
+        _maps_by_token.pop(entry[4], None)
+
+def _obstacle_map(grid: Grid) -> int:
+    """Token of the cached (W, H, blocked) map for grid, building it on first use."""
+    entry = _grid_cache.get(id(grid))
+    if entry is not None and entry[0] is grid:
+        return entry[4]
+    H = len(grid)
+    W = len(grid[0]) if H else 0
+    blocked = bytearray(W * H)
+    for y, row in enumerate(grid):
+        base = y * W
+        for x, cell in enumerate(row):
+            if cell != 0:
+                blocked[base + x] = 1
+    if len(_grid_cache) >= _GRID_CACHE_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        oldest = next(iter(_grid_cache))
+        _maps_by_token.pop(_grid_cache.pop(oldest)[4], None)
+    token = next(_tokens)
+    _grid_cache[id(grid)] = (grid, W, H, blocked, token)
+    _maps_by_token[token] = (W, H, blocked)
+    return token
+
+def astar(start: Node, goal: Node, grid: Grid, k: int = 16, weight: float = 1.0) -> Optional[List[Node]]:
+    """Shortest 4-connected path from start to goal over cells equal to 0.
+
+    weight scales the heuristic (see heuristic()); above 1.0 the search is
+    faster but the path is only near-shortest. Obstacle maps and results are
+    cached per grid object; call invalidate_grid() after mutating a grid in place.
+    """
+    path = _astar_cached(start, goal, _obstacle_map(grid), k, weight)
+    return list(path) if path is not None else None
+
+@lru_cache(maxsize=512)
+def _astar_cached(start: Node, goal: Node, token: int, k: int, weight: float) -> Optional[Tuple[Node, ...]]:
+    W, H, blocked = _maps_by_token[token]
+    return _search(start, goal, W, H, blocked, k, weight)
+
+def _search(start: Node, goal: Node, W: int, H: int, blocked: bytearray, k: int,
+            weight: float = 1.0) -> Optional[Tuple[Node, ...]]:
+    # Cells are flattened to idx = y * W + x so scores live in flat arrays
+    # instead of tuple-keyed dicts, and a closed bitmap stops re-expansion.
+    if not (0 <= start[0] < W and 0 <= start[1] < H and 0 <= goal[0] < W and 0 <= goal[1] < H):
+        return None
+    gx, gy = goal
+    start_idx = start[1] * W + start[0]
+    goal_idx = gy * W + gx
+    g, came_from, closed, buckets = _scratch_buffers(W, H)
+    g[start_idx] = 0
+    # Unit steps + Manhattan heuristic keep f small and non-decreasing, so the
+    # open set is a bucket queue indexed by f: O(1) push/pop, and the cursor
+    # only ever moves forward (a weighted heuristic can move it back).
+    weighted = weight != 1.0
+    cur = heuristic(start, goal, weight=weight)
+    while cur >= len(buckets):
+        buckets.append([])
+    buckets[cur].append(start_idx)
+    pending = 1
+    # A neighbour that steps toward the goal keeps f == cur, so it is already a
+    # minimal choice: follow it directly for up to k steps instead of
+    # round-tripping it through the bucket queue.
+    descend = -1
+    steps = 0
+
+    while pending or descend != -1:
+        if descend != -1:
+            current = descend
+            descend = -1
+            steps += 1
+        else:
+            while not buckets[cur]:
+                cur += 1
+            current = buckets[cur].pop()
+            pending -= 1
+            steps = 0
+        if closed[current]:
+            continue
+        closed[current] = 1
+        if current == goal_idx:
             path: List[Node] = []
-            while current:
-                path.append(current)
+            while current != -1:
+                y, x = divmod(current, W)
+                path.append((x, y))
                 current = came_from[current]
-            return list(reversed(path))
+            path.reverse()
+            return tuple(path)
 
-        for nxt in neighbors(current, grid):
-            tentative = g_score[current] + 1
-            if tentative < g_score.get(nxt, 1_000_000):
+        tentative = g[current] + 1
+        cy, cx = divmod(current, W)
+        for nxt, ok in (
+            (current + 1, cx + 1 < W),
+            (current - 1, cx > 0),
+            (current + W, cy + 1 < H),
+            (current - W, cy > 0),
+        ):
+            if ok and not blocked[nxt] and not closed[nxt] and tentative < g[nxt]:
                 came_from[nxt] = current
-                g_score[nxt] = tentative
-                f_score = tentative + heuristic(nxt, goal)
-                heappush(open_set, (f_score, nxt))
+                g[nxt] = tentative
+                ny, nx = divmod(nxt, W)
+                h = abs(nx - gx) + abs(ny - gy)
+                f = tentative + (int(weight * h) if weighted else h)
+                if f == cur and steps < k:
+                    # Keep the last downhill neighbour (what the LIFO bucket
+                    # would pop next); queue any earlier one
+                    nxt, descend = descend, nxt
+                    if nxt == -1:
+                        continue
+                    f = cur
+                if f < cur:
+                    cur = f
+                while f >= len(buckets):
+                    buckets.append([])
+                buckets[f].append(nxt)
+                pending += 1
     return None
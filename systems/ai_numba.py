@@ -0,0 +1,161 @@
+"""
+Numba-compiled A* for grid pathfinding.
+
+Same contract as systems.ai.astar: start/goal are (x, y), grid cells are 0 for
+walkable, and the result is the list of (x, y) steps from start to goal or None.
+Grids share systems.ai's per-grid obstacle-map cache and are memoized the same
+way, so the kernel only runs on a cache miss. When numba (and numpy) are not
+installed this module simply re-exports the pure-Python systems.ai.astar.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from systems.ai import Grid, Node, INF, _maps_by_token, _obstacle_map
+from systems.ai import astar as _astar_py
+
+try:
+    import numpy as np
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    np = None
+    njit = None
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True)
+    def _astar_kernel(grid, sx, sy, gx, gy, g, came, closed, head, link, entry, out_path):
+        """Write the goal->start cell indices into out_path; return the count (0 = no path).
+
+        g/came/closed/head/link/entry are caller-owned scratch buffers, reset here.
+        """
+        H, W = grid.shape
+        g[:] = INF
+        came[:] = -1
+        closed[:] = 0
+        # Bucket queue as intrusive linked lists: head[f] is the newest entry
+        # with that f, link[] chains older ones. f < size + W + H, and each cell
+        # is pushed at most once per neighbour, so both bounds are fixed.
+        head[:] = -1
+
+        start = sy * W + sx
+        goal = gy * W + gx
+        g[start] = 0
+        cur = abs(sx - gx) + abs(sy - gy)
+        entry[0] = start
+        link[0] = -1
+        head[cur] = 0
+        used = 1
+        pending = 1
+
+        while pending > 0:
+            while head[cur] == -1:
+                cur += 1
+            e = head[cur]
+            head[cur] = link[e]
+            pending -= 1
+            current = entry[e]
+            if closed[current]:
+                continue
+            closed[current] = 1
+            if current == goal:
+                n = 0
+                while current != -1:
+                    out_path[n] = current
+                    n += 1
+                    current = came[current]
+                return n
+
+            cy = current // W
+            cx = current - cy * W
+            tentative = g[current] + 1
+            for d in range(4):
+                nx = cx
+                ny = cy
+                if d == 0:
+                    nx += 1
+                elif d == 1:
+                    nx -= 1
+                elif d == 2:
+                    ny += 1
+                else:
+                    ny -= 1
+                if nx < 0 or nx >= W or ny < 0 or ny >= H or grid[ny, nx] != 0:
+                    continue
+                nxt = ny * W + nx
+                if closed[nxt] or tentative >= g[nxt]:
+                    continue
+                came[nxt] = current
+                g[nxt] = tentative
+                f = tentative + abs(nx - gx) + abs(ny - gy)
+                entry[used] = nxt
+                link[used] = head[f]
+                head[f] = used
+                used += 1
+                pending += 1
+        return 0
+
+    # Kernel input per obstacle-map token: a zero-copy uint8 view of systems.ai's map
+    _cells_by_token: Dict[int, "np.ndarray"] = {}
+    # Kernel scratch buffers, reallocated only when the grid shape changes
+    _scratch: Dict[str, object] = {"shape": None}
+
+    def _kernel_buffers(W: int, H: int) -> tuple:
+        if _scratch["shape"] != (W, H):
+            size = W * H
+            _scratch.update(
+                shape=(W, H),
+                buffers=(
+                    np.empty(size, np.int32),          # g
+                    np.empty(size, np.int32),          # came
+                    np.empty(size, np.uint8),          # closed
+                    np.empty(size + W + H, np.int32),  # head
+                    np.empty(4 * size + 1, np.int32),  # link
+                    np.empty(4 * size + 1, np.int32),  # entry
+                    np.empty(size, np.int32),          # out_path
+                ),
+            )
+        return _scratch["buffers"]
+
+    def _run_kernel(cells, start: Node, goal: Node) -> Optional[Tuple[Node, ...]]:
+        if cells.ndim != 2 or cells.size == 0:
+            return None
+        H, W = cells.shape
+        sx, sy = start
+        gx, gy = goal
+        if not (0 <= sx < W and 0 <= sy < H and 0 <= gx < W and 0 <= gy < H):
+            return None
+        buffers = _kernel_buffers(W, H)
+        n = _astar_kernel(cells, sx, sy, gx, gy, *buffers)
+        if n == 0:
+            return None
+        out = buffers[-1]
+        return tuple((int(i % W), int(i // W)) for i in out[n - 1::-1])
+
+    @lru_cache(maxsize=512)
+    def _astar_cached(start: Node, goal: Node, token: int) -> Optional[Tuple[Node, ...]]:
+        cells = _cells_by_token.get(token)
+        if cells is None:
+            # Drop views of maps systems.ai has since evicted or invalidated
+            for stale in [t for t in _cells_by_token if t not in _maps_by_token]:
+                del _cells_by_token[stale]
+            W, H, blocked = _maps_by_token[token]
+            cells = _cells_by_token[token] = np.frombuffer(blocked, dtype=np.uint8).reshape(H, W)
+        return _run_kernel(cells, start, goal)
+
+    def astar(start: Node, goal: Node, grid: Grid, weight: float = 1.0) -> Optional[List[Node]]:
+        # The kernel's bucket queue assumes the plain Manhattan heuristic
+        if weight != 1.0:
+            return _astar_py(start, goal, grid, weight=weight)
+        if isinstance(grid, np.ndarray):
+            # Prepared arrays may be mutated by the caller, so they bypass the memo
+            path = _run_kernel(grid, start, goal)
+        else:
+            path = _astar_cached(start, goal, _obstacle_map(grid))
+        return list(path) if path is not None else None
+
+else:
+    astar = _astar_py
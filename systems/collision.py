@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Iterable, Tuple
+from typing import Dict, Hashable, List, Sequence, Tuple
 import pygame
 
 Rect = pygame.Rect
@@ -7,8 +7,69 @@ Rect = pygame.Rect
 def rects_collide(a: Rect, b: Rect) -> bool:
     return a.colliderect(b)
 
-def rect_vs_many(rect: Rect, others: Iterable[Rect]) -> bool:
-    return any(rect.colliderect(other) for other in others)
+def rect_vs_many(rect: Rect, others: Sequence[Rect]) -> bool:
+    # collidelist runs the whole scan in C; pass a materialized list of Rects
+    return rect.collidelist(others) != -1
+
+def rect_vs_many_indices(rect: Rect, others: Sequence[Rect]) -> List[int]:
+    # Indices of every rect in others that overlaps rect
+    return rect.collidelistall(others)
+
+class SpatialHash:
+    # Uniform-grid broad phase. Rects are bucketed by every cell they overlap,
+    # so a query only looks at rects near the probe instead of all of them.
+    # Pick cell ~ the largest inserted rect; rebuild when the rects move.
+
+    def __init__(self, cell: int):
+        self.cell = max(1, int(cell))
+        self._buckets: Dict[Tuple[int, int], List[Tuple[Hashable, Rect]]] = {}
+
+    def _cells(self, rect: Rect):
+        c = self.cell
+        for cx in range(rect.left // c, (rect.right - 1) // c + 1):
+            for cy in range(rect.top // c, (rect.bottom - 1) // c + 1):
+                yield (cx, cy)
+
+    def insert(self, rect: Rect, key: Hashable) -> None:
+        for cell in self._cells(rect):
+            self._buckets.setdefault(cell, []).append((key, rect))
+
+    def query_items(self, rect: Rect) -> Dict[Hashable, Rect]:
+        # Candidate key -> rect for everything sharing a cell with rect
+        found: Dict[Hashable, Rect] = {}
+        for cell in self._cells(rect):
+            for key, other in self._buckets.get(cell, ()):
+                found[key] = other
+        return found
+
+    def query(self, rect: Rect) -> List[Rect]:
+        return list(self.query_items(rect).values())
+
+class GridOccupancy:
+    # Per-cell occupancy for objects that live on a fixed W x H tile grid
+    # (snake segments, maze actors): O(1) membership instead of a rect scan.
+    # Cells hold a count so overlapping adds/removes stay balanced.
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self._cells = bytearray(width * height)
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def add(self, idx: int) -> None:
+        self._cells[idx] += 1
+
+    def remove(self, idx: int) -> None:
+        if self._cells[idx]:
+            self._cells[idx] -= 1
+
+    def contains(self, idx: int) -> bool:
+        return self._cells[idx] != 0
+
+    def clear(self) -> None:
+        self._cells[:] = bytes(len(self._cells))
 
 def point_in_grid(point: Tuple[int, int], grid_size: Tuple[int, int]) -> bool:
     x, y = point
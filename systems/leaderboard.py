@@ -1,7 +1,9 @@
 from __future__ import annotations
-import asyncio
-from typing import List, Dict
+import concurrent.futures
+import time
+from typing import List, Dict, Optional, Tuple
 import pygame
+from async_helper import submit_async
 
 class LeaderboardManager:
     """Manages fetching and displaying game leaderboards."""
@@ -11,56 +13,132 @@ class LeaderboardManager:
         self.cache: Dict[str, List[dict]] = {}
         self.cache_timeout = 60.0  # 60 seconds
         self.last_fetch: Dict[str, float] = {}
+        # Fetches in flight on the shared background loop, one per game
+        self._pending: Dict[str, concurrent.futures.Future] = {}
+        # Bumped per game when a score write lands; fetches started under an
+        # older generation are discarded so they cannot cache pre-write rows
+        self._generation: Dict[str, int] = {}
+        # Fonts are built once; SysFont lookups are slow
+        self.header_font = pygame.font.SysFont("arial", 18)
+        self.entry_font = pygame.font.SysFont("arial", 20)
+        # Rendered lines keyed by (font, text, color), oldest evicted past 256
+        self._text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+        self._text_cache_for: Tuple | None = None
+        # Composited panel and the (entries, title font) it was built for
+        self._panel: pygame.Surface | None = None
+        self._panel_key: Tuple | None = None
     
     def get_leaderboard(self, game: str, limit: int = 10, force_refresh: bool = False) -> List[dict]:
-        #Get leaderboard for a game with caching
-        import time
-        current_time = time.time()
+        #Get leaderboard for a game with caching.
+        #Never blocks: stale or missing entries are refreshed in the background
+        #and the cached list (possibly empty) is returned right away.
+        current_time = time.monotonic()
         
-        # Check cache
-        if not force_refresh and game in self.cache:
-            if current_time - self.last_fetch.get(game, 0) < self.cache_timeout:
-                return self.cache[game]
+        # Check cache (a failed fetch is stamped too, so it is retried only
+        # after cache_timeout instead of on every frame)
+        if not force_refresh and current_time - self.last_fetch.get(game, float("-inf")) < self.cache_timeout:
+            return self.cache.get(game, [])
         
-        # Fetch from database
+        # Fetch from database on the async_helper loop
+        if game not in self._pending:
+            # Generation the fetch starts under, read before it is submitted
+            gen = self._generation.get(game, 0)
+            try:
+                fut = submit_async(self.db.get_leaderboard(game, limit))
+            except Exception as e:
+                print(f"❌ Failed to fetch leaderboard: {e}")
+                self.last_fetch[game] = current_time
+                return self.cache.get(game, [])
+            self._pending[game] = fut
+            fut.add_done_callback(lambda f, game=game, gen=gen: self._on_fetched(game, gen, f))
+        return self.cache.get(game, [])
+    
+    def _on_fetched(self, game: str, gen: int, fut: concurrent.futures.Future) -> None:
+        if self._pending.get(game) is fut:
+            self._pending.pop(game)
+        if gen != self._generation.get(game, 0):
+            # A score was written after this fetch began; its rows may be stale
+            return
         try:
-            leaderboard = asyncio.run(self.db.get_leaderboard(game, limit))
-            self.cache[game] = leaderboard
-            self.last_fetch[game] = current_time
-            return leaderboard
+            self.cache[game] = fut.result()
         except Exception as e:
             print(f"❌ Failed to fetch leaderboard: {e}")
-            return self.cache.get(game, [])
+        self.last_fetch[game] = time.monotonic()
     
-    def save_score_sync(self, player_name: str, game: str, score: int, level: int = 1) -> bool:
-        """Save score synchronously (call from game over screen)."""
+    def save_score_sync(self, player_name: str, game: str, score: int, level: int = 1, wait: bool = False) -> Optional[bool]:
+        """Save a score without stalling the frame.
+
+        The write runs on the background loop. Pass wait=True on a final game-over
+        screen to block up to 0.5 s for confirmation.
+        Returns True if the write is confirmed, None if it was submitted but not
+        (yet) confirmed (wait=False, or the wait timed out while it keeps
+        running), and False if it failed.
+        """
         try:
-            asyncio.run(self.db.save_score(player_name, game, score, level))
-            # Invalidate cache for this game
-            if game in self.cache:
-                del self.cache[game]
+            fut = submit_async(self.db.save_score(player_name, game, score, level))
+            # Invalidate the cache only once the write has committed
+            fut.add_done_callback(lambda f, game=game: self._on_saved(game, f))
+            if not wait:
+                return None
+            fut.result(timeout=0.5)
             return True
+        except concurrent.futures.TimeoutError:
+            return None
         except Exception as e:
             print(f"❌ Failed to save score: {e}")
             return False
     
+    def _on_saved(self, game: str, fut: concurrent.futures.Future) -> None:
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        self._generation[game] = self._generation.get(game, 0) + 1
+        self.last_fetch.pop(game, None)
+        # Let the next get_leaderboard start a fresh fetch right away
+        self._pending.pop(game, None)
+    
+    def _render_cached(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (font, text, color)
+        surf = self._text_cache.pop(key, None)
+        if surf is None:
+            surf = font.render(text, True, color)
+            if len(self._text_cache) >= 256:
+                del self._text_cache[next(iter(self._text_cache))]
+        # Re-insert so the dict order tracks recency
+        self._text_cache[key] = surf
+        return surf
+    
     def draw_leaderboard(self, screen: pygame.Surface, game: str, x: int, y: int, font: pygame.font.Font):
         #Draw leaderboard on screen
         leaderboard = self.get_leaderboard(game, limit=10)
+        # The whole panel is composited once per distinct content and then
+        # blitted in a single call while nothing changes
+        entries_key = (game, tuple((e['player_name'], e['score'], e['level']) for e in leaderboard))
+        panel_key = (entries_key, font)
+        if panel_key != self._panel_key:
+            if entries_key != self._text_cache_for:
+                # Drop rendered lines once the shown entries change
+                self._text_cache.clear()
+                self._text_cache_for = entries_key
+            self._panel = self._build_panel(game, leaderboard, font)
+            self._panel_key = panel_key
+        screen.blit(self._panel, (x, y))
+    
+    def _build_panel(self, game: str, leaderboard: List[dict], font: pygame.font.Font) -> pygame.Surface:
+        lines: List[Tuple[pygame.Surface, int]] = []  # (surface, y offset)
+        y = 0
         
         # Title
-        title = font.render(f"{game.upper()} - TOP 10", True, (255, 255, 255))
-        screen.blit(title, (x, y))
+        title = self._render_cached(font, f"{game.upper()} - TOP 10", (255, 255, 255))
+        lines.append((title, y))
         y += 40
         
         # Headers
-        header_font = pygame.font.SysFont("arial", 18)
-        header = header_font.render("RANK  PLAYER           SCORE    LEVEL", True, (200, 200, 200))
-        screen.blit(header, (x, y))
+        header = self._render_cached(self.header_font, "RANK  PLAYER           SCORE    LEVEL", (200, 200, 200))
+        lines.append((header, y))
         y += 30
         
         # Scores
-        entry_font = pygame.font.SysFont("arial", 20)
+        entry_font = self.entry_font
         for i, entry in enumerate(leaderboard, 1):
             color = (255, 215, 0) if i == 1 else (192, 192, 192) if i == 2 else (205, 127, 50) if i == 3 else (255, 255, 255)
             
@@ -70,10 +148,17 @@ class LeaderboardManager:
             level_val = f"{entry['level']:3d}"
             
             line = f"{rank}  {player}  {score_val}  {level_val}"
-            text = entry_font.render(line, True, color)
-            screen.blit(text, (x, y))
+            text = self._render_cached(entry_font, line, color)
+            lines.append((text, y))
             y += 28
         
         if not leaderboard:
-            text = entry_font.render("No scores yet!", True, (150, 150, 150))
-            screen.blit(text, (x, y))
+            text = self._render_cached(entry_font, "No scores yet!", (150, 150, 150))
+            lines.append((text, y))
+        
+        width = max(surf.get_width() for surf, _ in lines)
+        height = max(oy + surf.get_height() for surf, oy in lines)
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        for surf, oy in lines:
+            panel.blit(surf, (0, oy))
+        return panel
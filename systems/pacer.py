@@ -0,0 +1,60 @@
+from __future__ import annotations
+import time
+from collections import deque
+from typing import Deque
+
+
+# Seconds before the deadline at which beat() stops sleeping and starts spinning
+_SPIN_WINDOW = 0.0005
+
+
+class Pacer:
+    """
+    Frame pacer built on time.perf_counter().
+
+    Replaces pygame.time.Clock.tick(), whose sleep granularity can be off by
+    ~10 ms on some platforms. The pacer sleeps until about 0.5 ms before the next
+    frame deadline and spins the remainder, yielding the CPU on each pass, so
+    frame times stay steady without burning a core.
+    """
+
+    def __init__(self, fps: int, samples: int = 60):
+        self.period = 1.0 / fps
+        now = time.perf_counter()
+        self.prev = now
+        self.next_t = now + self.period
+        # Recent frame durations for get_fps()
+        self._frame_times: Deque[float] = deque(maxlen=samples)
+
+    def beat(self) -> float:
+        """Wait for the next frame boundary. Returns seconds since the previous beat."""
+        sleep_for = self.next_t - time.perf_counter()
+        if sleep_for > _SPIN_WINDOW:
+            time.sleep(sleep_for - _SPIN_WINDOW)
+        while time.perf_counter() < self.next_t:
+            time.sleep(0)
+        return self._advance(time.perf_counter())
+
+    def mark(self) -> float:
+        """Record a frame boundary without waiting, for callers that already blocked
+        (e.g. in pygame.event.wait). Returns seconds since the previous frame."""
+        now = time.perf_counter()
+        self.next_t = now
+        return self._advance(now)
+
+    def _advance(self, now: float) -> float:
+        dt = now - self.prev
+        self.prev = now
+        self.next_t += self.period
+        # More than a frame behind (hitch, window drag): resync instead of bursting to catch up
+        if now - self.next_t > self.period:
+            self.next_t = now + self.period
+        self._frame_times.append(dt)
+        return dt
+
+    def get_fps(self) -> float:
+        """Average frames per second over the recent frame window."""
+        total = sum(self._frame_times)
+        if total <= 0:
+            return 0.0
+        return len(self._frame_times) / total
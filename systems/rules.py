@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Dict, Any, Literal
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Literal, Mapping
 
 # Type alias for difficulty levels
 DifficultyLevel = Literal["easy", "intermediate", "hard"]
@@ -10,7 +12,32 @@ class GameRuleSet:
     name: str
     difficulty: DifficultyLevel = "intermediate"
     level: int = 1
-    data: Dict[str, Any] = field(default_factory=dict)
+    # Read-only and shared between rule sets; copy it if a game needs to mutate
+    data: Mapping[str, Any] = field(default_factory=dict)
+
+
+# Per-game level scaling; level_factor = level - 1 (increases difficulty per level).
+# Each game's base rules always define the keys its scaler touches.
+def _scale_tetris(rules: Dict[str, Any], level_factor: int) -> None:
+    # Gravity gets faster each level (min 0.1 seconds)
+    rules["gravity_delay"] = max(0.1, rules["gravity_delay"] - (level_factor * 0.05))
+
+
+def _scale_snake(rules: Dict[str, Any], level_factor: int) -> None:
+    # Speed increases slightly each level
+    rules["fps"] = min(30, rules["fps"] + level_factor)
+
+
+def _scale_pac_man(rules: Dict[str, Any], level_factor: int) -> None:
+    # Ghosts get faster, frightened time shorter
+    rules["ghost_speed_ratio"] = min(1.2, rules["ghost_speed_ratio"] + (level_factor * 0.05))
+    rules["frightened_time"] = max(3.0, rules["frightened_time"] - (level_factor * 0.5))
+
+
+def _scale_space_invaders(rules: Dict[str, Any], level_factor: int) -> None:
+    # Enemies get faster, shoot more often
+    rules["enemy_speed"] = min(80, rules["enemy_speed"] + (level_factor * 5))
+    rules["enemy_shoot_delay"] = max(0.3, rules["enemy_shoot_delay"] - (level_factor * 0.1))
 
 
 class RulesManager:
@@ -52,6 +79,7 @@ class RulesManager:
             "frightened_time": 8.0,  # seconds ghosts stay frightened
             "scatter_time": 7.0,  # seconds ghosts scatter
             "chase_time": 20.0,  # seconds ghosts chase
+            "heuristic_weight": 1.0,  # ghost A* heuristic weight (>1: faster, less exact chase)
         },
         "space_invaders": {
             "lives": 3,
@@ -91,6 +119,14 @@ class RulesManager:
         },
     }
     
+    # Level scaler per game; games without one do not scale with level
+    _SCALERS: Dict[str, Callable[[Dict[str, Any], int], None]] = {
+        "tetris": _scale_tetris,
+        "snake": _scale_snake,
+        "pac_man": _scale_pac_man,
+        "space_invaders": _scale_space_invaders,
+    }
+    
     def __init__(self):
         self._current_difficulty: DifficultyLevel = "intermediate"
     
@@ -128,30 +164,15 @@ class RulesManager:
             GameRuleSet with computed game settings
         """
         diff = difficulty or self._current_difficulty
-        
-        # Start with base rules
-        base = self.BASE_RULES.get(game_name, {}).copy()
-        
-        # Apply difficulty modifiers
-        if game_name in self.DIFFICULTY_MODIFIERS:
-            modifiers = self.DIFFICULTY_MODIFIERS[game_name].get(diff, {})
-            base.update(modifiers)
-        
-        # Apply level scaling
-        base = self._apply_level_scaling(game_name, base, level)
-        
-        # Add score multiplier
-        base["score_multiplier"] = self.get_score_multiplier(diff)
-        
         return GameRuleSet(
             name=game_name,
             difficulty=diff,
             level=level,
-            data=base
+            data=_compute_rules(game_name, diff, level)
         )
     
+    @staticmethod
     def _apply_level_scaling(
-        self,
         game_name: str,
         rules: Dict[str, Any],
         level: int
@@ -160,36 +181,38 @@ class RulesManager:
         if level <= 1:
             return rules
         
-        # Level scaling factor (increases difficulty per level)
-        level_factor = level - 1
-        
-        if game_name == "tetris":
-            # Gravity gets faster each level (min 0.1 seconds)
-            gravity = rules.get("gravity_delay", 0.8)
-            rules["gravity_delay"] = max(0.1, gravity - (level_factor * 0.05))
-        
-        elif game_name == "snake":
-            # Speed increases slightly each level
-            fps = rules.get("fps", 15)
-            rules["fps"] = min(30, fps + level_factor)
-        
-        elif game_name == "pac_man":
-            # Ghosts get faster, frightened time shorter
-            ghost_ratio = rules.get("ghost_speed_ratio", 0.9)
-            rules["ghost_speed_ratio"] = min(1.2, ghost_ratio + (level_factor * 0.05))
-            frightened = rules.get("frightened_time", 8.0)
-            rules["frightened_time"] = max(3.0, frightened - (level_factor * 0.5))
-        
-        elif game_name == "space_invaders":
-            # Enemies get faster, shoot more often
-            speed = rules.get("enemy_speed", 30)
-            rules["enemy_speed"] = min(80, speed + (level_factor * 5))
-            shoot_delay = rules.get("enemy_shoot_delay", 1.5)
-            rules["enemy_shoot_delay"] = max(0.3, shoot_delay - (level_factor * 0.1))
-        
+        scale = RulesManager._SCALERS.get(game_name)
+        if scale:
+            scale(rules, level - 1)
         return rules
 
 
+@lru_cache(maxsize=256)
+def _compute_rules(game_name: str, diff: DifficultyLevel, level: int) -> Mapping[str, Any]:
+    """Rules for (game, difficulty, level) as a shared read-only mapping; pure, so memoized."""
+    # Base rules with difficulty modifiers laid over them (a new dict; the tables are untouched)
+    modifiers = RulesManager.DIFFICULTY_MODIFIERS.get(game_name, {}).get(diff, {})
+    base = {**RulesManager.BASE_RULES.get(game_name, {}), **modifiers}
+    
+    # Apply level scaling
+    base = RulesManager._apply_level_scaling(game_name, base, level)
+    
+    # Add score multiplier
+    base["score_multiplier"] = RulesManager.SCORE_MULTIPLIERS.get(diff, 1.0)
+    return MappingProxyType({key: _freeze(value) for key, value in base.items()})
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of a rule value: lists become tuples and dicts read-only mappings."""
+    # The proxy above is shallow, so nested containers (e.g. hybrid "components")
+    # would otherwise be shared by every caller and by BASE_RULES itself
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
 # Global rules manager instance
 _rules_manager = RulesManager()
 
@@ -61,17 +61,18 @@ def hybrid_score(event: ScoreEvent) -> int:
 
 FORMAT_SUFFIX = {0: "", 1: " pt", 2: " pts"}
 
+DIFFICULTY_MULTIPLIERS: Dict[str, float] = {
+    "easy": 0.8,
+    "intermediate": 1.0,
+    "hard": 1.5,
+}
+
 def format_score(score: int) -> str:
     suffix = FORMAT_SUFFIX[min(len(FORMAT_SUFFIX) - 1, score if score < 3 else 2)]
     return f"{score}{suffix}"
 
 def score_multiplier_bonus(difficulty: str, levels: int) -> tuple[float, int]:
-    difficulty_multipliers = {
-        "easy": 0.8,
-        "intermediate": 1.0,
-        "hard": 1.5,
-    }
-    multiplier = difficulty_multipliers.get(difficulty.lower(), 1.0)
+    multiplier = DIFFICULTY_MULTIPLIERS.get(difficulty.lower(), 1.0)
     
     # Every 10 levels, add a flat bonus (level * 10)
     bonus = 0
@@ -145,3 +146,4 @@ def calculate_score_breakdown(
         time_bonus=time_bonus,
         final_score=final_score,
     )
+
@@ -1,9 +1,28 @@
 from __future__ import annotations
-from pathlib import Path
-from typing import Dict
+import io
+import logging
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 import pygame
 from settings import SOUND_DIR
 
+_log = logging.getLogger(__name__)
+
+# Decoded sounds by absolute path, shared by every SoundManager so a file is
+# only decoded once while anything still holds it
+_SOUND_CACHE: "weakref.WeakValueDictionary[str, pygame.mixer.Sound]" = weakref.WeakValueDictionary()
+
+@lru_cache(maxsize=None)
+def _sound_path(filename: str) -> str:
+    # Absolute posix path for a file in SOUND_DIR, resolved once per filename
+    return (SOUND_DIR / filename).as_posix()
+
+# Size of the effect channel pool; a power of two so the cursor wraps with a mask
+_NUM_CHANNELS = 16
+
 class SoundManager:
     DEFAULT_SOUNDS = {
         # Tetris sounds
@@ -23,9 +42,18 @@ class SoundManager:
         "power_up": "power_up.wav",
         "menu_select": "menu_select.wav",
     }
+    # Long sounds played through pygame.mixer.music, which streams from disk
+    # instead of decoding the whole file. SDL_mixer has a single music
+    # channel, so only one of these plays at a time; others fall back to Sound.
+    STREAMING_SOUNDS = {"siren"}
 
     def __init__(self):
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        # Keys already attempted, so repeated per-game loads are no-ops
+        self.loaded: Set[str] = set()
+        # Streaming keys -> file path, and the key currently on the music channel
+        self.streams: Dict[str, str] = {}
+        self._stream_key: Optional[str] = None
         self._volume: float = 0.7  # Default volume (0.0 to 1.0)
         self._muted: bool = False
         
@@ -33,47 +61,195 @@ class SoundManager:
         if not pygame.mixer.get_init():
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
 
+        # Fixed channel pool handed out round-robin, so play() never has
+        # SDL_mixer scan for a free channel. A channel is only reused after
+        # _NUM_CHANNELS newer plays, which outlasts any short effect.
+        pygame.mixer.set_num_channels(_NUM_CHANNELS)
+        self._channels = [pygame.mixer.Channel(i) for i in range(_NUM_CHANNELS)]
+        self._next_channel = 0
+        # Indices of channels last started with a looped sound
+        self._looping: Set[int] = set()
+
     def load_assets(self) -> None:
         # Load all default sound assets.
         # Uses try/except to prevent crashes if files are missing.
-        for key, filename in self.DEFAULT_SOUNDS.items():
-            self.load_sound(key, filename)
+        self.load_many(self.DEFAULT_SOUNDS.items())
 
-    def load_sound(self, key: str, filename: str) -> None:
-        # Load a single sound file with error handling.
-        path = SOUND_DIR / filename
+    def load_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        # Load several (key, filename) pairs, skipping keys already attempted.
+        # Reading the files is blocking I/O, so the raw bytes are read on a
+        # small thread pool; pygame.mixer.Sound is only ever built here on
+        # the calling thread, which also fills both caches.
+        todo = [(key, filename) for key, filename in items if key not in self.loaded]
+        if not todo:
+            return
+        # One directory read answers every existence check in the batch
+        available = _available_files()
+        # Paths still to decode -> the keys waiting on them
+        to_decode: Dict[str, List[str]] = {}
+        for key, filename in todo:
+            if key in self.STREAMING_SOUNDS:
+                self.load_sound(key, filename, available)
+                continue
+            path = self._find_sound(key, filename, available)
+            if path is not None:
+                to_decode.setdefault(path, []).append(key)
+        if len(to_decode) <= 1:
+            for path, keys in to_decode.items():
+                self._store_decoded(keys, path, lambda: pygame.mixer.Sound(path))
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_decode))) as pool:
+                futures = {pool.submit(_read_bytes, path): path for path in to_decode}
+                for future in as_completed(futures):
+                    path = futures[future]
+                    self._store_decoded(
+                        to_decode[path], path,
+                        lambda: pygame.mixer.Sound(file=io.BytesIO(future.result())))
+        _log.debug("Sound assets loaded: %d sounds.", len(self.sounds))
+
+    def preload(self, keys: Iterable[str]) -> None:
+        # Load the named DEFAULT_SOUNDS entries ahead of first play (e.g. on game start).
+        self.load_many((key, self.DEFAULT_SOUNDS[key]) for key in keys if key in self.DEFAULT_SOUNDS)
+
+    def load_sound(self, key: str, filename: str, available: Optional[Set[str]] = None) -> None:
+        # Load a single sound file with error handling. available is an
+        # optional set of filenames in SOUND_DIR to check instead of stat().
+        if key in self.STREAMING_SOUNDS:
+            # Nothing to decode up front; just remember where the file is
+            self.loaded.add(key)
+            path = _sound_path(filename)
+            if _file_exists(filename, path, available):
+                self.streams[key] = path
+            else:
+                _log.warning("Sound file not found: %s", filename)
+            return
+        self._decode_now(key, filename, available)
+        _log.debug("Sound assets loaded: %d sounds.", len(self.sounds))
+
+    def _decode_now(self, key: str, filename: str, available: Optional[Set[str]] = None) -> None:
+        path = self._find_sound(key, filename, available)
+        if path is not None:
+            self._store_decoded([key], path, lambda: pygame.mixer.Sound(path))
+
+    def _find_sound(self, key: str, filename: str, available: Optional[Set[str]]) -> Optional[str]:
+        # Resolve key from the shared cache, or return the path that still
+        # needs decoding. Missing files are logged and marked as attempted.
+        path = _sound_path(filename)
+        sound = _SOUND_CACHE.get(path)
+        if sound is not None:
+            self._store(key, sound)
+            return None
+        if not _file_exists(filename, path, available):
+            _log.warning("Sound file not found: %s", filename)
+            self._store(key, None)
+            return None
+        return path
+
+    def _store_decoded(self, keys: List[str], path: str, decode: Callable[[], pygame.mixer.Sound]) -> None:
+        # Run (or collect) one decode and record the result for every waiting key.
+        sound: Optional[pygame.mixer.Sound] = None
         try:
-            if not path.exists():
-                print(f"[SoundManager] Warning: Sound file not found: {filename}")
-                return
-            sound = pygame.mixer.Sound(path.as_posix())
-            sound.set_volume(self._volume)
-            self.sounds[key] = sound
+            sound = decode()
+            _SOUND_CACHE[path] = sound
         except pygame.error as e:
-            print(f"[SoundManager] Error loading {filename}: {e}")
-        except Exception as e:
-            print(f"[SoundManager] Unexpected error loading {filename}: {e}")
+            _log.warning("Error loading %s: %s", os.path.basename(path), e)
+        except Exception:
+            _log.exception("Unexpected error loading %s", os.path.basename(path))
+        for key in keys:
+            self._store(key, sound)
 
-        print(f"Sound assets loaded: {len(self.sounds)} sounds.")
+    def _store(self, key: str, sound: Optional[pygame.mixer.Sound]) -> None:
+        self.loaded.add(key)
+        if sound is not None:
+            self.sounds[key] = sound
 
-    def play(self, key: str) -> None:
-        # Play a sound effect by key name.
+    def play(self, key: str, loops: int = 0) -> None:
+        # Play a sound effect by key name. loops repeats it that many extra
+        # times; -1 loops until stop().
         if self._muted:
             return
-        sound = self.sounds.get(key)
+        if key in self.STREAMING_SOUNDS and key not in self.sounds:
+            if key not in self.loaded:
+                self.load_sound(key, self.DEFAULT_SOUNDS[key])
+            if self._play_stream(key, loops):
+                return
+        sound = self.sounds.get(key) or self._lazy_load(key)
         if sound:
-            sound.play()
+            # Volume is applied here rather than in set_volume, so slider drags
+            # cost one call per play instead of one per loaded sound
+            sound.set_volume(self._volume)
+            self._next_channel_for(loops).play(sound, loops)
+
+    def _next_channel_for(self, loops: int) -> pygame.mixer.Channel:
+        # Prefer an idle channel, scanning from the round-robin cursor. When
+        # every channel is busy, a one-shot takes the next channel in order
+        # that is not playing a looped sound, so loops are never cut off.
+        channels = self._channels
+        start = self._next_channel
+        order = [(start + i) & (_NUM_CHANNELS - 1) for i in range(_NUM_CHANNELS)]
+        index = next((i for i in order if not channels[i].get_busy()), None)
+        if index is None:
+            index = next((i for i in order if i not in self._looping), start)
+        self._next_channel = (index + 1) & (_NUM_CHANNELS - 1)
+        if loops:
+            self._looping.add(index)
+        else:
+            self._looping.discard(index)
+        return channels[index]
+
+    def _play_stream(self, key: str, loops: int) -> bool:
+        # Play a streaming sound on the music channel. Returns False if it is
+        # missing, cannot be streamed, or another stream holds the channel.
+        path = self.streams.get(key)
+        if path is None:
+            return False
+        music = pygame.mixer.music
+        if music.get_busy():
+            if self._stream_key == key:
+                return True
+            # Channel taken: fall back to a fully decoded Sound for this key
+            self._decode_now(key, self.DEFAULT_SOUNDS[key])
+            return False
+        try:
+            music.load(path)
+            music.set_volume(self._volume)
+            music.play(loops)
+        except pygame.error as e:
+            # e.g. a container the music decoder rejects; decode it as a Sound instead
+            _log.warning("Error streaming %s: %s", path, e)
+            self._decode_now(key, self.DEFAULT_SOUNDS[key])
+            return False
+        self._stream_key = key
+        return True
+
+    def _lazy_load(self, key: str) -> Optional[pygame.mixer.Sound]:
+        # Decode a DEFAULT_SOUNDS entry on its first play; misses are only tried once.
+        if key in self.loaded or key not in self.DEFAULT_SOUNDS:
+            return None
+        self.load_sound(key, self.DEFAULT_SOUNDS[key])
+        return self.sounds.get(key)
 
     def stop(self, key: str) -> None:
         # Stop a specific sound.
+        if key == self._stream_key:
+            self._stop_stream()
         sound = self.sounds.get(key)
         if sound:
             sound.stop()
 
     def stop_all(self) -> None:
-        # Stop all sound effects.
-        for sound in self.sounds.values():
-            sound.stop()
+        # Stop all sound effects: one call halts every mixer channel.
+        self._stop_stream()
+        try:
+            pygame.mixer.stop()
+        except pygame.error:
+            for sound in self.sounds.values():
+                sound.stop()
+
+    def _stop_stream(self) -> None:
+        if self._stream_key is not None:
+            pygame.mixer.music.stop()
+            self._stream_key = None
 
     @property
     def volume(self) -> float:
@@ -83,9 +259,10 @@ class SoundManager:
     def set_volume(self, val: float) -> None:
         # Set volume for all sound effects.
         # val: Volume level from 0.0 (silent) to 1.0 (max)
+        # Sound effects pick it up on their next play()
         self._volume = max(0.0, min(1.0, val))
-        for sound in self.sounds.values():
-            sound.set_volume(self._volume)
+        if self._stream_key is not None:
+            pygame.mixer.music.set_volume(self._volume)
 
     @property
     def muted(self) -> bool:
@@ -94,9 +271,30 @@ class SoundManager:
 
     def toggle_mute(self) -> bool:
         # Toggle mute state. Returns new muted state.
-        self._muted = not self._muted
+        self.set_muted(not self._muted)
         return self._muted
 
     def set_muted(self, muted: bool) -> None:
-        # Set mute state directly.
+        # Set mute state directly. Streams play on past the mixer channels,
+        # so muting stops them outright.
         self._muted = muted
+        if muted:
+            self._stop_stream()
+
+
+def _available_files() -> Optional[Set[str]]:
+    # Filenames directly in SOUND_DIR, or None if it cannot be listed
+    try:
+        return set(os.listdir(SOUND_DIR))
+    except OSError:
+        return None
+
+def _file_exists(filename: str, path: str, available: Optional[Set[str]]) -> bool:
+    if available is not None and os.sep not in filename and "/" not in filename:
+        return filename in available
+    return os.path.exists(path)
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
@@ -1,17 +1,58 @@
 from __future__ import annotations
-from typing import Optional, Dict
+from typing import Optional, Dict, Union
 import bcrypt
 import asyncio
 
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+    HAS_ARGON2 = True
+except ImportError:
+    HAS_ARGON2 = False
+    PasswordHasher = None
 
-def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+# bcrypt cost for new hashes (library default is 12). Existing hashes keep
+# their own cost, which is embedded in the hash and honoured by checkpw.
+BCRYPT_ROUNDS = 10
 
+# New hashes use argon2id when argon2-cffi is installed (OWASP minimum
+# profile: 19 MiB, 2 passes). bcrypt hashes ("$2...") still verify and are
+# upgraded on the next successful login.
+_argon2 = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1) if HAS_ARGON2 else None
 
-def verify_password(password: str, password_hash: str) -> bool:
-    """Verify a password against its hash."""
-    return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+
+def _to_bytes(password: Union[str, bytes]) -> bytes:
+    return password.encode("utf-8") if isinstance(password, str) else password
+
+
+def _is_bcrypt(password_hash: str) -> bool:
+    return password_hash.startswith("$2")
+
+
+def hash_password(password: Union[str, bytes]) -> str:
+    """Hash a password using argon2id, or bcrypt if argon2-cffi is unavailable."""
+    if _argon2 is not None:
+        return _argon2.hash(_to_bytes(password))
+    return bcrypt.hashpw(_to_bytes(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
+
+
+def verify_password(password: Union[str, bytes], password_hash: str) -> bool:
+    """Verify a password against its hash (argon2id or bcrypt)."""
+    if _is_bcrypt(password_hash):
+        return bcrypt.checkpw(_to_bytes(password), password_hash.encode("utf-8"))
+    if _argon2 is None:
+        return False
+    try:
+        return _argon2.verify(password_hash, _to_bytes(password))
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(password_hash: str) -> bool:
+    """True if the hash should be replaced by a fresh hash_password() result."""
+    if _argon2 is None:
+        return False
+    return _is_bcrypt(password_hash) or _argon2.check_needs_rehash(password_hash)
 
 
 async def register_user_async(db, username: str, email: str, password: str) -> Optional[int]:
@@ -19,30 +60,34 @@ async def register_user_async(db, username: str, email: str, password: str) -> O
     Register a new user with username, email and password.
     Returns user_id if successful, None if username/email already exists.
     """
-    password_hash = hash_password(password)
+    # Password hashing is CPU-bound; run it on a worker thread so the event loop stays free
+    password_hash = await asyncio.to_thread(hash_password, password)
     return await db.create_user(username, email, password_hash)
 
 
 async def login_user_async(db, identifier: str, password: str) -> Optional[Dict]:
     """
     Login user with username OR email and password.
-    Returns user data dict if successful, None otherwise.
+    Returns {user_id, username, email} if successful, None otherwise.
     """
-    # Try to find user by username first
-    user = await db.get_user_by_username(identifier)
-    
-    # If not found, try by email
-    if not user:
-        user = await db.get_user_by_email(identifier)
+    # One lookup matching either column; a username match takes precedence
+    user = await db.get_user_auth(identifier)
     
     if not user:
         return None
     
     # Verify password
-    if verify_password(password, user['password_hash']):
+    if await asyncio.to_thread(verify_password, password, user['password_hash']):
         # Update login streak
         await db.update_login_streak(user['user_id'])
-        return user
+        # Upgrade old bcrypt (or outdated argon2) hashes while we have the plaintext
+        if password_needs_rehash(user['password_hash']):
+            try:
+                new_hash = await asyncio.to_thread(hash_password, password)
+                await db.update_password_hash(user['user_id'], new_hash)
+            except Exception as e:
+                print(f"Password rehash failed: {e}")
+        return {key: user[key] for key in ("user_id", "username", "email")}
     
     return None
 
@@ -62,6 +107,8 @@ def login_user(username: str, password: str) -> bool:
 class UserSession:
     """Holds the current logged-in user's session data."""
     
+    __slots__ = ("user_id", "username", "email", "is_logged_in")
+    
     def __init__(self):
         self.user_id: Optional[int] = None
         self.username: Optional[str] = None